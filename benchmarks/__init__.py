@@ -0,0 +1,2 @@
+from .core import benchmark, getBenchmarks, measure, run
+from . import client
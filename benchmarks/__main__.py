@@ -0,0 +1,45 @@
+import argparse
+import json
+import platform
+import sys
+from . import run
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        prog="python -m benchmarks",
+        description="Measure client side overhead of the gDrive library",
+    )
+    parser.add_argument(
+        "--sizes",
+        type=int,
+        nargs="+",
+        default=[1_000, 10_000, 100_000],
+        help="page sizes used by sized benchmarks",
+    )
+    parser.add_argument(
+        "--only", nargs="+", default=None, help="names of benchmarks to run"
+    )
+    parser.add_argument(
+        "--min-time",
+        type=float,
+        default=0.2,
+        help="minimum measured time per benchmark in seconds",
+    )
+    parser.add_argument("--output", default=None, help="write JSON to this file")
+    args = parser.parse_args()
+    report = {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "results": run(args.sizes, args.only, int(args.min_time * 1e9)),
+    }
+    if args.output is not None:
+        with open(args.output, "w") as file:
+            json.dump(report, file, indent=2)
+    else:
+        json.dump(report, sys.stdout, indent=2)
+        sys.stdout.write("\n")
+
+
+if __name__ == "__main__":
+    main()
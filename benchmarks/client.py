@@ -0,0 +1,294 @@
+import asyncio
+import json
+import threading
+import time
+from gDrive import gDrive, gDriveFiles, gCredentials, Scopes, fq
+from gDrive.data import File, Files
+from gDrive.Files import ChildQuery
+from gDrive.utils import FolderMimeType
+from gService.gAsync import gAsyncResourceManager, gAsyncRunner
+from gService.gColumns import gColumns
+from gService.gData import gData, gListData
+from gService.gModel import gJsonModel
+from typing import Any, Callable
+from .core import benchmark
+from .stub import StubResource, makeFile, makeFilesPage
+
+
+def _filesManager(pageSize: int = 1) -> gDriveFiles:
+    page = makeFilesPage(pageSize)
+    return gDriveFiles(
+        StubResource(
+            {
+                "get": lambda fileId, **_: makeFile(0) | {"id": fileId},
+                "list": lambda **_: page,
+            }
+        )
+    )
+
+
+@benchmark("files.get.dispatch", sized=False)
+def filesGetDispatch(size: int) -> Callable[[], Any]:
+    files = _filesManager()
+    return lambda: files.get("file-00000000", supportsAllDrives=True)
+
+
+@benchmark("files.get.name", sized=False)
+def filesGetName(size: int) -> Callable[[], Any]:
+    files = _filesManager()
+    return lambda: files.get("file-00000000").name
+
+
+@benchmark("files.list.dispatch", sized=False)
+def filesListDispatch(size: int) -> Callable[[], Any]:
+    files = _filesManager()
+    return lambda: files.list(pageSize=1000, orderBy=["name", "folder"])
+
+
+@benchmark("files.list.getFields")
+def filesListGetFields(size: int) -> Callable[[], Any]:
+    files = _filesManager(size)
+    return lambda: files.list(pageSize=size).files.getFields(
+        File.id, File.name, File.mimeType, File.size, File.parents
+    )
+
+
+@benchmark("gData.getFields", sized=False)
+def gDataGetFields(size: int) -> Callable[[], Any]:
+    files = _filesManager()
+    return lambda: files.get("file-00000000").getFields(
+        File.id, File.name, File.size, File.owners, File.capabilities
+    )
+
+
+@benchmark("query.build", sized=False)
+def queryBuild(size: int) -> Callable[[], Any]:
+    return lambda: str(fq().name.Eq("report.pdf") & fq().parents.Include("folder"))
+
+
+@benchmark("query.prepared", sized=False)
+def queryPrepared(size: int) -> Callable[[], Any]:
+    return lambda: ChildQuery(name="report.pdf", parentId="folder")
+
+
+@benchmark("gDataclass.names", sized=False)
+def gDataclassNames(size: int) -> Callable[[], Any]:
+    return lambda: File(File.id, File.name, File.mimeType, File.size, File.parents)
+
+
+@benchmark("gDataclass.kwargs", sized=False)
+def gDataclassKwargs(size: int) -> Callable[[], Any]:
+    return lambda: File(name="video.mp4", description="description", parents=["a"])
+
+
+@benchmark("gDataclass.nested", sized=False)
+def gDataclassNested(size: int) -> Callable[[], Any]:
+    return lambda: File(
+        File.name,
+        File.Capabilities(File.Capabilities.canEdit, File.Capabilities.canCopy),
+        File.ContentHints(File.ContentHints.indexableText),
+    )
+
+
+@benchmark("gData.convertFields", sized=False)
+def convertFields(size: int) -> Callable[[], Any]:
+    fields: Any = {
+        "nextPageToken": None,
+        "files": {
+            0: {"id": None, "name": None, "owners": {None: {"displayName": None}}},
+            1: {"size": None, "capabilities": {"canEdit": None}},
+        },
+    }
+    return lambda: gData._convertFieldsToGoogleFormat(fields)
+
+
+@benchmark("gListData.setData")
+def listSetData(size: int) -> Callable[[], Any]:
+    payload = makeFilesPage(size)["files"]
+    resource: Any = StubResource()
+
+    def run() -> gListData[File]:
+        parent = gData(Files.List, resource)
+        data = gListData("files", File, parent)
+        data.setData(payload)
+        return data
+
+    return run
+
+
+@benchmark("gListData.setData.idName")
+def listSetDataIdName(size: int) -> Callable[[], Any]:
+    payload = [{"id": v["id"], "name": v["name"]} for v in makeFilesPage(size)["files"]]
+    resource: Any = StubResource()
+
+    def run() -> gListData[File]:
+        parent = gData(Files.List, resource)
+        data = gListData("files", File, parent)
+        data.setData(payload)
+        return data
+
+    return run
+
+
+def _hydrateAndRead(size: int, view: bool) -> Callable[[], Any]:
+    payload = makeFilesPage(size)["files"]
+    resource: Any = StubResource()
+
+    def run() -> gListData[File]:
+        parent = gData(Files.List, resource, view=view)
+        data = gListData("files", File, parent)
+        data.setData(payload)
+        for i in range(len(data)):
+            item = data[i]
+            item.id, item.name, item.owners[0].displayName
+        return data
+
+    return run
+
+
+@benchmark("gListData.hydrate.classic")
+def listHydrateClassic(size: int) -> Callable[[], Any]:
+    return _hydrateAndRead(size, False)
+
+
+@benchmark("gListData.hydrate.view")
+def listHydrateView(size: int) -> Callable[[], Any]:
+    return _hydrateAndRead(size, True)
+
+
+@benchmark("gColumns.extend")
+def columnsExtend(size: int) -> Callable[[], Any]:
+    payload = makeFilesPage(size)["files"]
+
+    def run() -> gColumns[File]:
+        columns = gColumns(
+            File,
+            (File.id, File.name, File.mimeType, File.size, File.parents),
+            integers=[File.size],
+        )
+        columns.extend(payload)
+        return columns
+
+    return run
+
+
+def _decodePage(size: int, model: gJsonModel) -> Callable[[], Any]:
+    content = json.dumps(makeFilesPage(size)).encode("utf-8")
+    return lambda: model.deserialize(content)
+
+
+@benchmark("model.decode.stdlib")
+def modelDecodeStdlib(size: int) -> Callable[[], Any]:
+    return _decodePage(size, gJsonModel(decoder=json.loads))
+
+
+@benchmark("model.decode.fast")
+def modelDecodeFast(size: int) -> Callable[[], Any]:
+    return _decodePage(size, gJsonModel())
+
+
+@benchmark("gDrive.startup", sized=False)
+def driveStartup(size: int) -> Callable[[], Any]:
+    credentials = gCredentials([Scopes.DriveReadonly]).api_key("key")
+    return lambda: gDrive(credentials)
+
+
+@benchmark("gDrive.startup.files", sized=False)
+def driveStartupFiles(size: int) -> Callable[[], Any]:
+    credentials = gCredentials([Scopes.DriveReadonly]).api_key("key")
+    return lambda: gDrive(credentials).files
+
+
+def _treeManager(latency: float) -> gDriveFiles:
+    folders: dict[str, list[dict[str, Any]]] = {"root": []}
+    for i in range(10):
+        folders["root"].append(
+            {"id": f"d{i}", "name": f"d{i}", "mimeType": FolderMimeType}
+        )
+        folders[f"d{i}"] = []
+        for j in range(10):
+            folderId = f"d{i}-{j}"
+            folders[f"d{i}"].append(
+                {"id": folderId, "name": folderId, "mimeType": FolderMimeType}
+            )
+            folders[folderId] = [makeFile(k) for k in range(5)]
+    for parentId, children in folders.items():
+        for child in children:
+            child["parents"] = [parentId]
+
+    def listFolder(q: Any = None, **_: Any) -> dict[str, Any]:
+        time.sleep(latency)
+        if q is None:
+            return {"files": [f for children in folders.values() for f in children]}
+        parentIds = str(q).split("'")[1::2]
+        return {"files": [f for p in parentIds for f in folders.get(p, [])]}
+
+    return gDriveFiles(
+        StubResource({"get": lambda **_: {"id": "root"}, "list": listFolder})
+    )
+
+
+@benchmark("files.TreeId.serial", sized=False)
+def filesTreeIdSerial(size: int) -> Callable[[], Any]:
+    files = _treeManager(0.002)
+    return lambda: files.TreeId("root", maxWorkers=1)
+
+
+@benchmark("files.TreeId.concurrent", sized=False)
+def filesTreeIdConcurrent(size: int) -> Callable[[], Any]:
+    files = _treeManager(0.002)
+    return lambda: files.TreeId("root", maxWorkers=8)
+
+
+@benchmark("files.TreeId.level", sized=False)
+def filesTreeIdLevel(size: int) -> Callable[[], Any]:
+    files = _treeManager(0.002)
+    return lambda: files.TreeId("root", maxWorkers=1, strategy="level")
+
+
+@benchmark("files.TreeId.levelConcurrent", sized=False)
+def filesTreeIdLevelConcurrent(size: int) -> Callable[[], Any]:
+    files = _treeManager(0.002)
+    return lambda: files.TreeId("root", maxWorkers=8, strategy="level")
+
+
+@benchmark("files.Snapshot.TreeId", sized=False)
+def filesSnapshotTreeId(size: int) -> Callable[[], Any]:
+    files = _treeManager(0.002)
+    return lambda: files.Snapshot().TreeId("root")
+
+
+def _asyncGets(maxConcurrency: int, latency: float) -> Callable[[], Any]:
+    lock = threading.Lock()
+    active = [0]
+
+    def getFile(fileId: str, **_: Any) -> dict[str, Any]:
+        with lock:
+            active[0] += 1
+            if active[0] > maxConcurrency:
+                raise RuntimeError("Concurrency limit exceeded")
+        try:
+            time.sleep(latency)
+            return makeFile(0) | {"id": fileId}
+        finally:
+            with lock:
+                active[0] -= 1
+
+    files = gDriveFiles(StubResource({"get": getFile}))
+
+    async def fetchAll() -> None:
+        manager = gAsyncResourceManager(files, gAsyncRunner(maxConcurrency))
+        results = await asyncio.gather(*[manager.get(f"f{i}") for i in range(32)])
+        await asyncio.gather(*[f.fetch(File.name) for f in results])
+
+    return lambda: asyncio.run(fetchAll())
+
+
+@benchmark("async.get.serial", sized=False)
+def asyncGetSerial(size: int) -> Callable[[], Any]:
+    return _asyncGets(1, 0.002)
+
+
+@benchmark("async.get.concurrent", sized=False)
+def asyncGetConcurrent(size: int) -> Callable[[], Any]:
+    return _asyncGets(8, 0.002)
@@ -0,0 +1,79 @@
+import gc
+import time
+import tracemalloc
+from typing import Any, Callable, Iterable
+
+
+Setup = Callable[[int], Callable[[], Any]]
+
+_registry: list[tuple[str, Setup, bool]] = []
+
+
+def benchmark(name: str, sized: bool = True) -> Callable[[Setup], Setup]:
+    def decorator(setup: Setup) -> Setup:
+        _registry.append((name, setup, sized))
+        return setup
+
+    return decorator
+
+
+def getBenchmarks() -> list[tuple[str, Setup, bool]]:
+    return list(_registry)
+
+
+def _callsFor(minimumNs: int, function: Callable[[], Any]) -> int:
+    start = time.perf_counter_ns()
+    function()
+    elapsed = max(time.perf_counter_ns() - start, 1)
+    return max(1, min(100_000, minimumNs // elapsed))
+
+
+def measure(
+    name: str, size: int, function: Callable[[], Any], minimumNs: int = 200_000_000
+) -> dict[str, Any]:
+    calls = _callsFor(minimumNs, function)
+    gc.collect()
+    gc.disable()
+    try:
+        start = time.perf_counter_ns()
+        for _ in range(calls):
+            function()
+        elapsed = time.perf_counter_ns() - start
+    finally:
+        gc.enable()
+
+    gc.collect()
+    tracemalloc.start()
+    try:
+        before = tracemalloc.take_snapshot()
+        tracemalloc.reset_peak()
+        baseline, _ = tracemalloc.get_traced_memory()
+        result = function()
+        _, peak = tracemalloc.get_traced_memory()
+        after = tracemalloc.take_snapshot()
+    finally:
+        tracemalloc.stop()
+    del result
+    stats = after.compare_to(before, "lineno")
+    return {
+        "name": name,
+        "size": size,
+        "calls": calls,
+        "nsPerCall": elapsed // calls,
+        "allocations": sum(s.count_diff for s in stats if s.count_diff > 0),
+        "allocatedBytes": sum(s.size_diff for s in stats if s.size_diff > 0),
+        "peakBytes": peak - baseline,
+    }
+
+
+def run(
+    sizes: Iterable[int], names: Iterable[str] | None = None, minimumNs: int = 200_000_000
+) -> list[dict[str, Any]]:
+    selected = set(names) if names is not None else None
+    results: list[dict[str, Any]] = []
+    for name, setup, sized in _registry:
+        if selected is not None and name not in selected:
+            continue
+        for size in sizes if sized else (1,):
+            results.append(measure(name, size, setup(size), minimumNs))
+    return results
@@ -0,0 +1,68 @@
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+from typing import Any
+
+
+DeferredModules = (
+    "googleapiclient.discovery",
+    "googleapiclient.http",
+    "googleapiclient.model",
+    "google.auth.transport.requests",
+    "google_auth_oauthlib",
+    "concurrent.futures",
+)
+
+
+def measureImport(module: str) -> tuple[int, list[str]]:
+    code = (
+        f"import sys, json; import {module}; "
+        f"print(json.dumps([m for m in {DeferredModules!r} if m in sys.modules]))"
+    )
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    cumulative = 0
+    for line in result.stderr.splitlines():
+        parts = line.split("|")
+        if len(parts) == 3 and parts[2].strip() == module:
+            cumulative = int(parts[1])
+    return cumulative, json.loads(result.stdout)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        prog="python -m benchmarks.importtime",
+        description="Check the import time of a module against a budget",
+    )
+    parser.add_argument("--module", default="gDrive", help="module to import")
+    parser.add_argument(
+        "--budget", type=float, default=150, help="budget in milliseconds"
+    )
+    parser.add_argument("--runs", type=int, default=5, help="number of imports")
+    args = parser.parse_args()
+    times: list[int] = []
+    loaded: list[str] = []
+    for _ in range(args.runs):
+        us, loaded = measureImport(args.module)
+        times.append(us)
+    median = statistics.median(times) / 1000
+    report: dict[str, Any] = {
+        "module": args.module,
+        "medianMs": median,
+        "budgetMs": args.budget,
+        "deferredModulesLoaded": loaded,
+    }
+    json.dump(report, sys.stdout, indent=2)
+    print()
+    if median > args.budget or len(loaded) > 0:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,124 @@
+from typing import Any, Callable
+
+
+Handler = Callable[..., Any]
+
+
+def parseFields(fields: str) -> dict[str, Any]:
+    result: dict[str, Any] = {}
+    stack: list[dict[str, Any]] = [result]
+    name = ""
+    for c in fields + ",":
+        if c == "(":
+            child: dict[str, Any] = {}
+            stack[-1][name.strip()] = child
+            stack.append(child)
+            name = ""
+        elif c == ")":
+            if name.strip():
+                stack[-1][name.strip()] = None
+            stack.pop()
+            name = ""
+        elif c == ",":
+            if name.strip():
+                stack[-1][name.strip()] = None
+            name = ""
+        else:
+            name += c
+    return result
+
+
+def filterPayload(data: Any, fields: dict[str, Any] | None) -> Any:
+    if fields is None or len(fields) == 0:
+        return data
+    if type(data) is list:
+        return [filterPayload(v, fields) for v in data]
+    if type(data) is not dict:
+        return data
+    return {
+        k: filterPayload(data[k], v) for k, v in fields.items() if k in data
+    }
+
+
+def makeUser(i: int) -> dict[str, Any]:
+    return {
+        "kind": "drive#user",
+        "displayName": f"user{i}",
+        "me": i == 0,
+        "permissionId": f"perm{i}",
+        "emailAddress": f"user{i}@example.com",
+    }
+
+
+def makeFile(i: int) -> dict[str, Any]:
+    return {
+        "kind": "drive#file",
+        "id": f"file-{i:08d}",
+        "name": f"document-{i}.txt",
+        "mimeType": "text/plain" if i % 10 else "application/vnd.google-apps.folder",
+        "parents": [f"folder-{i // 100:08d}"],
+        "size": str(i * 37),
+        "quotaBytesUsed": str(i * 37),
+        "md5Checksum": f"{i:032x}",
+        "createdTime": "2024-01-01T00:00:00.000Z",
+        "modifiedTime": "2024-01-02T00:00:00.000Z",
+        "starred": False,
+        "trashed": False,
+        "owners": [makeUser(i % 5)],
+        "capabilities": {"canEdit": True, "canCopy": True, "canDelete": False},
+    }
+
+
+def makeFilesPage(count: int, nextPageToken: str | None = None) -> dict[str, Any]:
+    page: dict[str, Any] = {
+        "kind": "drive#fileList",
+        "incompleteSearch": False,
+        "files": [makeFile(i) for i in range(count)],
+    }
+    if nextPageToken is not None:
+        page["nextPageToken"] = nextPageToken
+    return page
+
+
+class StubRequest:
+    def __init__(self, handler: Handler, kwargs: dict[str, Any], methodId: str) -> None:
+        self._handler = handler
+        self._kwargs = kwargs
+        self.methodId = methodId
+
+    def execute(self, *args: Any, **kwargs: Any) -> Any:
+        data = self._handler(**self._kwargs)
+        return filterPayload(data, parseFields(self._kwargs.get("fields", "")))
+
+
+class StubMethod:
+    def __init__(self, resource: "StubResource", name: str) -> None:
+        self._resource = resource
+        self._name = name
+
+    def __call__(self, **kwargs: Any) -> StubRequest:
+        self._resource.calls += 1
+        handler = self._resource.handlers.get(self._name, lambda **_: {})
+        methodId = f"drive.{self._resource.name}.{self._name}"
+        return StubRequest(handler, kwargs, methodId)
+
+
+class StubResource:
+    def __init__(
+        self, handlers: dict[str, Handler] | None = None, name: str = "files"
+    ) -> None:
+        self.handlers = handlers if handlers is not None else {}
+        self.name = name
+        self.calls = 0
+
+    def __getattr__(self, name: str) -> StubMethod:
+        return StubMethod(self, name)
+
+    def __enter__(self) -> "StubResource":
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        pass
+
+    def close(self) -> None:
+        pass
@@ -1,7 +1,8 @@
-from gService.gResourceManager import gResourceManager
+from gService.gResourceManager import gResourceManager, resourceMethod
 from .data import About
 
 
 class gDriveAbout(gResourceManager):
+    @resourceMethod
     def get(self) -> About:
         return self._getResource("execute")
@@ -0,0 +1,88 @@
+from gService import gCredentials
+from gService.gAsync import gAsyncResourceManager, gAsyncRunner
+from gService.gDiscovery import gDiscoveryCache, defaultDiscoveryCache
+from functools import cached_property
+from types import TracebackType
+from typing import TYPE_CHECKING, Any, Self
+from . import gDrive
+from .About import gDriveAbout
+from .Changes import gDriveChanges
+from .Channels import gDriveChannels
+from .Comments import gDriveComments
+from .Drives import gDriveDrives
+from .Files import gDriveFiles
+from .Permissions import gDrivePermissions
+from .Replies import gDriveReplies
+from .Revisions import gDriveRevisions
+
+if TYPE_CHECKING:
+    from googleapiclient.model import BaseModel
+
+
+class AsyncgDrive:
+    def __init__(
+        self,
+        credentials: gCredentials,
+        maxConcurrency: int = 10,
+        model: "BaseModel | None" = None,
+        discoveryCache: gDiscoveryCache = defaultDiscoveryCache,
+        clientOptions: dict[str, Any] | None = None,
+    ) -> None:
+        self.runner = gAsyncRunner(maxConcurrency)
+        self.drive = gDrive(
+            credentials,
+            model,
+            discoveryCache,
+            maxConnections=maxConcurrency,
+            clientOptions=clientOptions,
+        )
+
+    @cached_property
+    def about(self) -> gAsyncResourceManager[gDriveAbout]:
+        return gAsyncResourceManager(self.drive.about, self.runner)
+
+    @cached_property
+    def changes(self) -> gAsyncResourceManager[gDriveChanges]:
+        return gAsyncResourceManager(self.drive.changes, self.runner)
+
+    @cached_property
+    def channels(self) -> gAsyncResourceManager[gDriveChannels]:
+        return gAsyncResourceManager(self.drive.channels, self.runner)
+
+    @cached_property
+    def comments(self) -> gAsyncResourceManager[gDriveComments]:
+        return gAsyncResourceManager(self.drive.comments, self.runner)
+
+    @cached_property
+    def drives(self) -> gAsyncResourceManager[gDriveDrives]:
+        return gAsyncResourceManager(self.drive.drives, self.runner)
+
+    @cached_property
+    def files(self) -> gAsyncResourceManager[gDriveFiles]:
+        return gAsyncResourceManager(self.drive.files, self.runner)
+
+    @cached_property
+    def permissions(self) -> gAsyncResourceManager[gDrivePermissions]:
+        return gAsyncResourceManager(self.drive.permissions, self.runner)
+
+    @cached_property
+    def replies(self) -> gAsyncResourceManager[gDriveReplies]:
+        return gAsyncResourceManager(self.drive.replies, self.runner)
+
+    @cached_property
+    def revisions(self) -> gAsyncResourceManager[gDriveRevisions]:
+        return gAsyncResourceManager(self.drive.revisions, self.runner)
+
+    async def close(self) -> None:
+        await self.runner.run(self.drive.Close)
+
+    async def __aenter__(self) -> Self:
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_val: BaseException | None,
+        exc_tb: TracebackType | None,
+    ) -> None:
+        await self.close()
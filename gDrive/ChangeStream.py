@@ -0,0 +1,151 @@
+from .data import Change
+import os
+import threading
+import time
+from abc import abstractmethod
+from typing import TYPE_CHECKING, Any, Callable, Generator
+
+if TYPE_CHECKING:
+    from .Changes import gDriveChanges
+
+
+class gCheckpoint:
+    @abstractmethod
+    def load(self) -> str | None: ...
+
+    @abstractmethod
+    def save(self, pageToken: str) -> None: ...
+
+
+class gMemoryCheckpoint(gCheckpoint):
+    def __init__(self, pageToken: str | None = None) -> None:
+        self.pageToken = pageToken
+
+    def load(self) -> str | None:
+        return self.pageToken
+
+    def save(self, pageToken: str) -> None:
+        self.pageToken = pageToken
+
+
+class gFileCheckpoint(gCheckpoint):
+    def __init__(self, path: str) -> None:
+        self.path = os.path.expanduser(path)
+
+    def load(self) -> str | None:
+        try:
+            with open(self.path, "r", encoding="utf-8") as file:
+                pageToken = file.read().strip()
+        except FileNotFoundError:
+            return None
+        return pageToken if len(pageToken) > 0 else None
+
+    def save(self, pageToken: str) -> None:
+        tmpPath = f"{self.path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        try:
+            with open(tmpPath, "w", encoding="utf-8") as file:
+                file.write(pageToken)
+                file.flush()
+                os.fsync(file.fileno())
+            os.replace(tmpPath, self.path)
+        finally:
+            if os.path.exists(tmpPath):
+                os.remove(tmpPath)
+
+
+class gChangeStream:
+    def __init__(
+        self,
+        changes: "gDriveChanges",
+        *fields: Any,
+        checkpoint: gCheckpoint | None = None,
+        follow: bool = True,
+        minInterval: float = 1.0,
+        maxInterval: float = 60.0,
+        backoff: float = 2.0,
+        pageSize: int = 1000,
+        maxRetries: int = 5,
+        sleep: Callable[[float], None] = time.sleep,
+        **kwargs: Any,
+    ) -> None:
+        if minInterval <= 0 or maxInterval < minInterval or backoff < 1:
+            raise ValueError("Invalid polling intervals")
+        if maxRetries < 0:
+            raise ValueError("Invalid number of retries")
+        self.checkpoint = checkpoint if checkpoint is not None else gMemoryCheckpoint()
+        self.follow = follow
+        self.minInterval = minInterval
+        self.maxInterval = maxInterval
+        self.backoff = backoff
+        self.maxRetries = maxRetries
+        self.interval = minInterval
+        self.requests = 0
+        self.changes = 0
+        self.errors = 0
+        self._manager = changes
+        self._fields = fields
+        self._pageSize = pageSize
+        self._sleep = sleep
+        self._kwargs = kwargs
+
+    def _startPageToken(self) -> str:
+        pageToken = self.checkpoint.load()
+        if pageToken is None:
+            pageToken = self._manager.getStartPageToken(
+                self._kwargs.get("driveId"), self._kwargs.get("supportsAllDrives")
+            ).startPageToken
+            self.checkpoint.save(pageToken)
+        return pageToken
+
+    @staticmethod
+    def _isRetryable(error: Exception) -> bool:
+        from googleapiclient.errors import HttpError
+
+        if isinstance(error, HttpError):
+            return error.status_code == 429 or error.status_code >= 500
+        return isinstance(error, OSError)
+
+    def __iter__(self) -> Generator[Change, None, None]:
+        pageToken = self._startPageToken()
+        pages = self._manager.iterate(
+            self._manager.list,
+            *self._fields,
+            pageFields=["newStartPageToken"],
+            pageSize=self._pageSize,
+            prefetch=False,
+            **self._kwargs,
+        )
+        retries = 0
+        while True:
+            try:
+                page, nextPageToken = pages.fetch(pageToken)
+            except Exception as error:
+                if not self._isRetryable(error) or retries >= self.maxRetries:
+                    raise
+                retries += 1
+                self.errors += 1
+                self.interval = min(self.interval * self.backoff, self.maxInterval)
+                self._sleep(self.interval)
+                pageToken = self._startPageToken()
+                continue
+            retries = 0
+            self.requests += 1
+            count = 0
+            for change in pages.items(page):
+                count += 1
+                yield change
+            self.changes += count
+            if nextPageToken is not None:
+                pageToken = nextPageToken
+            else:
+                pageToken = page.newStartPageToken
+            self.checkpoint.save(pageToken)
+            if nextPageToken is not None:
+                continue
+            if not self.follow:
+                return
+            if count > 0:
+                self.interval = self.minInterval
+            else:
+                self.interval = min(self.interval * self.backoff, self.maxInterval)
+            self._sleep(self.interval)
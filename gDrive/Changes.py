@@ -1,15 +1,18 @@
-from gService.gResourceManager import gResourceManager
+from gService.gResourceManager import gResourceManager, resourceMethod
+from .ChangeStream import gChangeStream, gCheckpoint
 from .data import Channel, Changes
 from .data.helpers import IncludePermissionsForView, Space
-from typing import List
+from typing import Any, List
 
 
 class gDriveChanges(gResourceManager):
+    @resourceMethod
     def getStartPageToken(
         self, driveId: str | None = None, supportsAllDrives: bool | None = None
     ) -> Changes.GetStartPageToken:
         return self._getResource("executeOnlyOnce")
 
+    @resourceMethod
     def list(
         self,
         driveId: str | None = None,
@@ -26,6 +29,7 @@ class gDriveChanges(gResourceManager):
     ) -> Changes.List:
         return self._getResource("execute")
 
+    @resourceMethod
     def watch(
         self,
         channel: Channel,
@@ -45,3 +49,14 @@ class gDriveChanges(gResourceManager):
             "executeOnlyOnce",
             body="channel",
         )
+
+    def Stream(
+        self,
+        *fields: Any,
+        checkpoint: gCheckpoint | None = None,
+        follow: bool = True,
+        **kwargs: Any,
+    ) -> gChangeStream:
+        return gChangeStream(
+            self, *fields, checkpoint=checkpoint, follow=follow, **kwargs
+        )
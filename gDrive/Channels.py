@@ -1,7 +1,8 @@
-from gService.gResourceManager import gResourceManager
+from gService.gResourceManager import gResourceManager, resourceMethod
 from .data import Channel
 
 
 class gDriveChannels(gResourceManager):
+    @resourceMethod
     def stop(self, channel: Channel) -> None:
         return self._getResource("checkForErrors", body="channel")
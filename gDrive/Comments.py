@@ -1,15 +1,18 @@
-from gService.gResourceManager import gResourceManager
+from gService.gResourceManager import gResourceManager, resourceMethod
 import datetime
 from .data import Comment, Comments
 
 
 class gDriveComments(gResourceManager):
+    @resourceMethod
     def create(self, comment: Comment, fileId: str) -> Comment:
         return self._getResource("executeOnlyOnce", body="comment")
 
+    @resourceMethod
     def delete(self, fileId: str, commentId: str) -> None:
         return self._getResource("checkForErrors")
 
+    @resourceMethod
     def get(
         self,
         fileId: str,
@@ -18,6 +21,7 @@ class gDriveComments(gResourceManager):
     ) -> Comment:
         return self._getResource("execute")
 
+    @resourceMethod
     def list(
         self,
         fileId: str,
@@ -28,5 +32,6 @@ class gDriveComments(gResourceManager):
     ) -> Comments.List:
         return self._getResource("execute")
 
+    @resourceMethod
     def update(self, comment: Comment, fileId: str, commentId: str) -> Comment:
         return self._getResource("executeOnlyOnce", body="comment")
@@ -1,13 +1,15 @@
-from gService.gResourceManager import gResourceManager
+from gService.gResourceManager import gResourceManager, resourceMethod
 import uuid
 from .data import Drive, Drives
 from .query import BridgeTerm
 
 
 class gDriveDrives(gResourceManager):
+    @resourceMethod
     def create(self, drive: Drive, requestId: str = str(uuid.uuid4())) -> Drive:
         return self._getResource("executeOnlyOnce", body="drive")
 
+    @resourceMethod
     def delete(
         self,
         driveId: str,
@@ -16,12 +18,15 @@ class gDriveDrives(gResourceManager):
     ) -> None:
         return self._getResource("checkForErrors")
 
+    @resourceMethod
     def get(self, driveId: str, useDomainAdminAccess: bool | None = None) -> Drive:
         return self._getResource("execute")
 
+    @resourceMethod
     def hide(self, driveId: str) -> Drive:
         return self._getResource("executeOnlyOnce")
 
+    @resourceMethod
     def list(
         self,
         pageSize: int | None = None,
@@ -31,9 +36,11 @@ class gDriveDrives(gResourceManager):
     ) -> Drives.List:
         return self._getResource("execute")
 
+    @resourceMethod
     def unhide(self, driveId: str) -> Drive:
         return self._getResource("executeOnlyOnce")
 
+    @resourceMethod
     def update(
         self,
         drive: Drive,
@@ -1,12 +1,30 @@
-from gService.gResourceManager import gResourceManager
+from gService.gData import gBaseData
+from gService.gResourceManager import gResourceManager, resourceMethod
 import os
 from .data import Channel, Files, File
 from .data.helpers import IncludePermissionsForView, Space
+from .PathCache import gPathCache
 from .utils import FolderMimeType, processDrivePath
-from .query import BridgeTerm, FileQueryTerm as fq
-from googleapiclient.http import MediaDownloadProgress
+from .query import BridgeTerm, FileQueryTerm as fq, Parameter
+from collections import deque
 from io import BufferedWriter
-from typing import Any, List, Literal, Generator, overload, Union
+from itertools import islice
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    List,
+    Literal,
+    Generator,
+    cast,
+    overload,
+    Union,
+)
+
+if TYPE_CHECKING:
+    from .Index import gDriveIndex
+    from .Snapshot import gDriveSnapshot
+    from concurrent.futures import Future
+    from googleapiclient.http import MediaDownloadProgress
 
 
 GenerateIdsType = Literal["files", "shortcuts"]
@@ -24,9 +42,22 @@ ListOrderByItems = Literal[
     "viewedByMeTime",
 ]
 TreeResult = dict[tuple[str, str], Union["TreeResult", None]]
+TreeEntry = tuple[str, str, str, str]
+TreeStrategy = Literal["folder", "level"]
+
+
+ChildQuery = fq.prepare(
+    fq().name.Eq(Parameter("name")) & fq().parents.Include(Parameter("parentId"))
+)
+ParentQuery = fq.prepare(fq().parents.Include(Parameter("parentId")))
 
 
 class gDriveFiles(gResourceManager):
+    MaxQueryLength = 2000
+    pathCache: gPathCache | None = None
+    index: "gDriveIndex | None" = None
+
+    @resourceMethod
     def copy(
         self,
         fileId: str,
@@ -43,6 +74,7 @@ class gDriveFiles(gResourceManager):
     ) -> File:
         return self._uploadResource("filePath", "resumable", body="fileMetadata")
 
+    @resourceMethod
     def create(
         self,
         filePath: str,
@@ -59,15 +91,19 @@ class gDriveFiles(gResourceManager):
     ) -> File:
         return self._uploadResource("filePath", "resumable", body="fileMetadata")
 
+    @resourceMethod
     def delete(self, fileId: str, supportsAllDrives: bool | None = None) -> None:
         return self._getResource("checkForErrors")
 
+    @resourceMethod
     def emptyTrash(self, driveId: str | None = None) -> None:
         return self._getResource("checkForErrors")
 
+    @resourceMethod
     def export(self, fileId: str, fd: BufferedWriter, mimeType: str | None = None):
         return self._downloadResource("fd")
 
+    @resourceMethod
     def generateIds(
         self,
         count: int | None = None,
@@ -85,7 +121,7 @@ class gDriveFiles(gResourceManager):
         supportsAllDrives: bool | None = None,
         includePermissionsForView: IncludePermissionsForView | None = None,
         includeLabels: List[str] | None = None,
-    ) -> Generator[MediaDownloadProgress, Any, None]: ...
+    ) -> Generator["MediaDownloadProgress", Any, None]: ...
 
     @overload
     def get(
@@ -98,6 +134,7 @@ class gDriveFiles(gResourceManager):
         includeLabels: List[str] | None = None,
     ) -> File: ...
 
+    @resourceMethod
     def get(
         self,
         fileId: str,
@@ -112,6 +149,7 @@ class gDriveFiles(gResourceManager):
         else:
             return self._getResource("execute")
 
+    @resourceMethod
     def list(
         self,
         corpora: Literal["user", "domain", "drive", "allDrives"] | None = None,
@@ -128,16 +166,19 @@ class gDriveFiles(gResourceManager):
     ) -> Files.List:
         return self._getResource("execute")
 
+    @resourceMethod
     def listLabels(
         self, fileId: str, maxResults: int | None = None, pageToken: str | None = None
     ) -> Files.ListLabels:
         return self._getResource("execute")
 
+    @resourceMethod
     def modifyLabels(
         self, request: Files.ModifyLabelsRequest, fileId: str
     ) -> Files.ModifyLabels:
         return self._getResource("executeOnlyOnce", body="request")
 
+    @resourceMethod
     def update(
         self,
         fileId: str,
@@ -159,6 +200,7 @@ class gDriveFiles(gResourceManager):
             body="fileMetadata",
         )
 
+    @resourceMethod
     def watch(
         self,
         channel: Channel,
@@ -170,35 +212,209 @@ class gDriveFiles(gResourceManager):
     ) -> Channel:
         return self._getResource("executeOnlyOnce", body="channel")
 
+    def _FreshIndex(self) -> "gDriveIndex | None":
+        index = self.index
+        return index if index is not None and index.isFresh() else None
+
+    def _FromPayload(self, payload: dict[str, Any]) -> File:
+        file = self.get(payload["id"])
+        cast(gBaseData[File], file).setData(payload)
+        return file
+
+    def Get(self, fileId: str) -> File:
+        index = self._FreshIndex()
+        if index is not None:
+            payload = index.getPayload(fileId)
+            if payload is not None:
+                return self._FromPayload(payload)
+        from .Index import IndexedFields
+
+        return self.get(fileId).getFields(*IndexedFields)
+
+    def Children(self, folderId: str, pageSize: int = 1000) -> List[File]:
+        index = self._FreshIndex()
+        if index is not None:
+            return [self._FromPayload(p) for p in index.childrenPayloads(folderId)]
+        from .Index import IndexedFields
+
+        files = self.iterate(
+            self.list,
+            *IndexedFields,
+            q=ParentQuery(parentId=folderId),
+            pageSize=pageSize,
+            prefetch=False,
+        )
+        return [f for f in files]
+
     def GetDrivePathId(self, drivePath: str) -> str:
-        fileId, parts = processDrivePath(drivePath)
-        for part in parts:
-            query = fq().name.Eq(part) & fq().parents.Include(fileId)
-            files = self.list(q=query).files.getFields(File.id)
+        index = self._FreshIndex()
+        if index is not None:
+            return index.getDrivePathId(drivePath)
+        prefix, parts = processDrivePath(drivePath)
+        cache = self.pathCache
+        fileId, start = (prefix, 0) if cache is None else cache.get(prefix, parts)
+        for i in range(start, len(parts)):
+            query = ChildQuery(name=parts[i], parentId=fileId)
+            files = list(
+                islice(self.iterate(self.list, File.id, q=query, prefetch=False), 2)
+            )
             if len(files) != 1:
+                if len(files) == 0 and cache is not None:
+                    cache.setMissing(prefix, parts[: i + 1])
                 raise ValueError(
                     "Found multiple files with given name"
                     if len(files) > 1
                     else "Found no files with given name"
                 )
             fileId = files[0].id
+            if cache is not None:
+                cache.set(prefix, parts[: i + 1], fileId)
         return fileId
 
-    def TreeId(self, folderId: str) -> TreeResult:
-        query = fq().parents.Include(folderId)
-        files = self.list(q=query).files.getFields(File.id, File.name, File.mimeType)
+    def _ListFolders(self, folderIds: List[str], pageSize: int) -> List[TreeEntry]:
+        if len(folderIds) == 1:
+            files = self.iterate(
+                self.list,
+                File.id,
+                File.name,
+                File.mimeType,
+                q=ParentQuery(parentId=folderIds[0]),
+                pageSize=pageSize,
+                prefetch=False,
+            )
+            return [(folderIds[0], f.id, f.name, f.mimeType) for f in files]
+        terms = [fq().parents.Include(folderId) for folderId in folderIds]
+        files = self.iterate(
+            self.list,
+            File.id,
+            File.name,
+            File.mimeType,
+            File.parents,
+            q=terms[0].Or(*terms[1:]),
+            pageSize=pageSize,
+            prefetch=False,
+        )
+        wanted = set(folderIds)
+        return [
+            (parentId, f.id, f.name, f.mimeType)
+            for f in files
+            for parentId in f.parents
+            if parentId in wanted
+        ]
+
+    def _TakeFolders(self, folders: deque[str], strategy: TreeStrategy) -> List[str]:
+        result = [folders.popleft()]
+        if strategy == "folder":
+            return result
+        length = len(ParentQuery(parentId=result[0])) + 2
+        while len(folders) > 0:
+            length += len(ParentQuery(parentId=folders[0])) + 6
+            if length > self.MaxQueryLength:
+                break
+            result.append(folders.popleft())
+        return result
+
+    def IterTreeId(
+        self,
+        folderId: str,
+        maxWorkers: int | None = None,
+        pageSize: int = 1000,
+        strategy: TreeStrategy = "folder",
+    ) -> Generator[TreeEntry, None, None]:
+        if maxWorkers is None:
+            maxWorkers = self._getConcurrency()
+        folders = deque([folderId])
+        if maxWorkers <= 1:
+            while len(folders) > 0:
+                batch = self._TakeFolders(folders, strategy)
+                for entry in self._ListFolders(batch, pageSize):
+                    if entry[3] == FolderMimeType:
+                        folders.append(entry[1])
+                    yield entry
+            return
+        from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+
+        executor = ThreadPoolExecutor(max_workers=maxWorkers)
+        try:
+            pending: set["Future[List[TreeEntry]]"] = set()
+            while len(folders) > 0 or len(pending) > 0:
+                while len(folders) > 0 and len(pending) < maxWorkers:
+                    batch = self._TakeFolders(folders, strategy)
+                    pending.add(executor.submit(self._ListFolders, batch, pageSize))
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    for entry in future.result():
+                        if entry[3] == FolderMimeType:
+                            folders.append(entry[1])
+                        yield entry
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def IterTree(
+        self,
+        drivePath: str,
+        maxWorkers: int | None = None,
+        pageSize: int = 1000,
+        strategy: TreeStrategy = "folder",
+    ) -> Generator[TreeEntry, None, None]:
+        folderId = self.GetDrivePathId(drivePath)
+        return self.IterTreeId(folderId, maxWorkers, pageSize, strategy)
+
+    def TreeId(
+        self,
+        folderId: str,
+        maxWorkers: int | None = None,
+        pageSize: int = 1000,
+        strategy: TreeStrategy = "folder",
+    ) -> TreeResult:
         result: TreeResult = {}
-        for file in files:
-            key = (file.id, file.name)
-            if file.mimeType == FolderMimeType:
-                result[key] = self.TreeId(file.id)
+        folders: dict[str, TreeResult] = {folderId: result}
+        for parentId, fileId, name, mimeType in self.IterTreeId(
+            folderId, maxWorkers, pageSize, strategy
+        ):
+            if mimeType == FolderMimeType:
+                folders[fileId] = {}
+                folders[parentId][(fileId, name)] = folders[fileId]
             else:
-                result[key] = None
+                folders[parentId][(fileId, name)] = None
         return result
 
-    def Tree(self, drivePath: str) -> TreeResult:
+    def Tree(
+        self,
+        drivePath: str,
+        maxWorkers: int | None = None,
+        pageSize: int = 1000,
+        strategy: TreeStrategy = "folder",
+    ) -> TreeResult:
         folderId = self.GetDrivePathId(drivePath)
-        return self.TreeId(folderId)
+        return self.TreeId(folderId, maxWorkers, pageSize, strategy)
+
+    def Snapshot(
+        self,
+        q: str | BridgeTerm | None = None,
+        pageSize: int = 1000,
+        rootId: str | None = None,
+        **kwargs: Any,
+    ) -> "gDriveSnapshot":
+        from .Snapshot import gDriveSnapshot
+
+        if rootId is None:
+            rootId = self.get("root").id
+        files = self.iterate(
+            self.list,
+            File.id,
+            File.name,
+            File.mimeType,
+            File.parents,
+            File.size,
+            File.md5Checksum,
+            File.modifiedTime,
+            q=q,
+            pageSize=pageSize,
+            prefetch=False,
+            **kwargs,
+        )
+        return gDriveSnapshot(files.asColumns(integers=("size",)), rootId)
 
     def Delete(
         self,
@@ -206,7 +422,9 @@ class gDriveFiles(gResourceManager):
         supportsAllDrives: bool | None = None,
     ) -> None:
         fileId = self.GetDrivePathId(drivePath)
-        return self.delete(fileId, supportsAllDrives)
+        self.delete(fileId, supportsAllDrives)
+        if self.pathCache is not None:
+            self.pathCache.invalidate(fileId)
 
     def DownloadId(
         self,
@@ -256,7 +474,7 @@ class gDriveFiles(gResourceManager):
         )
 
     def _DownloadTree(self, tree: TreeResult, localFolderPath: str):
-        result: list[tuple[str, Generator[MediaDownloadProgress, Any, None]]] = []
+        result: list[tuple[str, Generator["MediaDownloadProgress", Any, None]]] = []
         for key, value in tree.items():
             path = os.path.join(localFolderPath, key[1])
             if value is None:
@@ -266,13 +484,25 @@ class gDriveFiles(gResourceManager):
                 result.extend(self._DownloadTree(value, path))
         return result
 
-    def DownloadFolderId(self, folderId: str, localPath: str | None = None):
+    def DownloadFolderId(
+        self,
+        folderId: str,
+        localPath: str | None = None,
+        strategy: TreeStrategy = "folder",
+    ):
         if localPath is not None:
             if not os.path.isdir(localPath):
                 os.makedirs(localPath)
         else:
             localPath = os.curdir
-        return self._DownloadTree(self.TreeId(folderId), localPath)
+        tree = self.TreeId(folderId, strategy=strategy)
+        return self._DownloadTree(tree, localPath)
 
-    def DownloadFolder(self, drivePath: str, localPath: str | None = None):
-        return self.DownloadFolderId(self.GetDrivePathId(drivePath), localPath)
+    def DownloadFolder(
+        self,
+        drivePath: str,
+        localPath: str | None = None,
+        strategy: TreeStrategy = "folder",
+    ):
+        folderId = self.GetDrivePathId(drivePath)
+        return self.DownloadFolderId(folderId, localPath, strategy)
@@ -0,0 +1,328 @@
+from gService.gColumns import gColumns
+from .data import Change, File
+from .utils import processDrivePath
+import os
+import sqlite3
+import threading
+import time
+from typing import TYPE_CHECKING, Any, Callable, Iterable
+
+if TYPE_CHECKING:
+    from .Changes import gDriveChanges
+    from .Files import gDriveFiles
+
+
+IndexedFields = (
+    File.id,
+    File.name,
+    File.mimeType,
+    File.parents,
+    File.size,
+    File.md5Checksum,
+    File.modifiedTime,
+    File.trashed,
+)
+
+_columnNames = (
+    "id",
+    "name",
+    "mimeType",
+    "size",
+    "md5Checksum",
+    "modifiedTime",
+    "trashed",
+)
+
+
+def _tablesSchema(files: str, parents: str) -> str:
+    return f"""
+CREATE TABLE IF NOT EXISTS {files} (
+    id TEXT PRIMARY KEY,
+    name TEXT NOT NULL,
+    mimeType TEXT,
+    size INTEGER,
+    md5Checksum TEXT,
+    modifiedTime TEXT,
+    trashed INTEGER
+);
+CREATE TABLE IF NOT EXISTS {parents} (
+    parentId TEXT NOT NULL,
+    fileId TEXT NOT NULL,
+    PRIMARY KEY (parentId, fileId)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS {parents}FileId ON {parents} (fileId);
+"""
+
+
+_schema = (
+    _tablesSchema("files", "parents")
+    + _tablesSchema("stagingFiles", "stagingParents")
+    + """
+CREATE INDEX IF NOT EXISTS filesName ON files (name);
+CREATE TABLE IF NOT EXISTS state (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+"""
+)
+
+
+class gDriveIndex:
+    def __init__(
+        self,
+        path: str = ":memory:",
+        maxAge: float = 60,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        self.maxAge = maxAge
+        self._clock = clock
+        self._lock = threading.Lock()
+        if path != ":memory:":
+            path = os.path.expanduser(path)
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+        self._connection.executescript(_schema)
+
+    def __enter__(self) -> "gDriveIndex":
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self.close()
+
+    def close(self) -> None:
+        with self._lock:
+            self._connection.close()
+
+    def _getState(self, key: str) -> str | None:
+        row = self._connection.execute(
+            "SELECT value FROM state WHERE key = ?", (key,)
+        ).fetchone()
+        return None if row is None else row[0]
+
+    def _setState(self, key: str, value: str) -> None:
+        self._connection.execute(
+            "INSERT OR REPLACE INTO state (key, value) VALUES (?, ?)", (key, value)
+        )
+
+    @property
+    def pageToken(self) -> str | None:
+        with self._lock:
+            return self._getState("pageToken")
+
+    @property
+    def rootId(self) -> str | None:
+        with self._lock:
+            return self._getState("rootId")
+
+    @property
+    def syncedAt(self) -> float | None:
+        with self._lock:
+            value = self._getState("syncedAt")
+        return None if value is None else float(value)
+
+    def isFresh(self) -> bool:
+        syncedAt = self.syncedAt
+        return syncedAt is not None and self._clock() - syncedAt <= self.maxAge
+
+    def _deleteState(self, key: str) -> None:
+        self._connection.execute("DELETE FROM state WHERE key = ?", (key,))
+
+    def _upsert(
+        self,
+        rows: Iterable[tuple[Any, ...]],
+        files: str = "files",
+        parents: str = "parents",
+    ) -> None:
+        execute = self._connection.execute
+        for fileId, name, mimeType, size, md5, modified, trashed, fileParents in rows:
+            execute(
+                f"INSERT OR REPLACE INTO {files} VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (fileId, name, mimeType, size, md5, modified, trashed),
+            )
+            execute(f"DELETE FROM {parents} WHERE fileId = ?", (fileId,))
+            if fileParents is not None:
+                self._connection.executemany(
+                    f"INSERT OR IGNORE INTO {parents} VALUES (?, ?)",
+                    [(parentId, fileId) for parentId in fileParents],
+                )
+
+    def _remove(self, fileId: str) -> None:
+        self._connection.execute("DELETE FROM files WHERE id = ?", (fileId,))
+        self._connection.execute("DELETE FROM parents WHERE fileId = ?", (fileId,))
+
+    def _finish(self, pageToken: str) -> None:
+        self._setState("pageToken", pageToken)
+        self._setState("syncedAt", repr(self._clock()))
+
+    def crawl(
+        self,
+        files: "gDriveFiles",
+        changes: "gDriveChanges",
+        resume: bool = True,
+        **kwargs: Any,
+    ) -> int:
+        with self._lock:
+            startPageToken = self._getState("crawlStartPageToken")
+            rootId = self._getState("crawlRootId")
+            listPageToken = self._getState("crawlPageToken")
+        if not resume or startPageToken is None or rootId is None:
+            startPageToken = changes.getStartPageToken().startPageToken
+            rootId = files.get("root").id
+            listPageToken = None
+            with self._lock, self._connection:
+                self._connection.execute("DELETE FROM stagingFiles")
+                self._connection.execute("DELETE FROM stagingParents")
+                self._deleteState("crawlPageToken")
+                self._setState("crawlStartPageToken", startPageToken)
+                self._setState("crawlRootId", rootId)
+        pages = files.iterate(
+            files.list, *IndexedFields, pageSize=1000, prefetch=False, **kwargs
+        )
+        while True:
+            page, nextPageToken = pages.fetch(listPageToken, view=True)
+            rows: gColumns[File] = gColumns(File, IndexedFields, ("size",))
+            rows.extend(pages.items(page))
+            with self._lock, self._connection:
+                self._upsert(
+                    (
+                        tuple(row[name] for name in _columnNames) + (row.parents,)
+                        for row in rows
+                    ),
+                    "stagingFiles",
+                    "stagingParents",
+                )
+                if nextPageToken is not None:
+                    self._setState("crawlPageToken", nextPageToken)
+            if nextPageToken is None:
+                break
+            listPageToken = nextPageToken
+        with self._lock, self._connection:
+            execute = self._connection.execute
+            execute("DELETE FROM files")
+            execute("DELETE FROM parents")
+            execute("INSERT INTO files SELECT * FROM stagingFiles")
+            execute("INSERT INTO parents SELECT * FROM stagingParents")
+            execute("DELETE FROM stagingFiles")
+            execute("DELETE FROM stagingParents")
+            for key in ("crawlPageToken", "crawlStartPageToken", "crawlRootId"):
+                self._deleteState(key)
+            self._setState("rootId", rootId)
+            self._finish(startPageToken)
+            return execute("SELECT COUNT(*) FROM files").fetchone()[0]
+
+    def sync(self, changes: "gDriveChanges", **kwargs: Any) -> int:
+        pageToken = self.pageToken
+        if pageToken is None:
+            raise RuntimeError('Index is empty, use "crawl" first')
+        pages = changes.iterate(
+            changes.list,
+            Change.fileId,
+            Change.removed,
+            File(*IndexedFields),
+            pageFields=["newStartPageToken"],
+            pageSize=1000,
+            prefetch=False,
+            **kwargs,
+        )
+        names = ["fileId", "removed"] + [f"file.{name}" for name in IndexedFields]
+        count = 0
+        while True:
+            page, nextPageToken = pages.fetch(pageToken, view=True)
+            rows: gColumns[Change] = gColumns(Change, names, ("file.size",))
+            rows.extend(pages.items(page))
+            with self._lock, self._connection:
+                for row in rows:
+                    if row.fileId is None:
+                        continue
+                    if row.removed or row["file.id"] is None:
+                        self._remove(row.fileId)
+                    else:
+                        self._upsert(
+                            [
+                                tuple(row[f"file.{name}"] for name in _columnNames)
+                                + (row["file.parents"],)
+                            ]
+                        )
+                    count += 1
+                if nextPageToken is not None:
+                    self._setState("pageToken", nextPageToken)
+                else:
+                    self._finish(page.newStartPageToken)
+            if nextPageToken is None:
+                return count
+            pageToken = nextPageToken
+
+    @staticmethod
+    def _toPayload(row: tuple[Any, ...], parents: list[str]) -> dict[str, Any]:
+        values = {k: v for k, v in zip(_columnNames, row) if v is not None}
+        if "size" in values:
+            values["size"] = str(values["size"])
+        if "trashed" in values:
+            values["trashed"] = bool(values["trashed"])
+        values["parents"] = parents
+        return values
+
+    def _getParents(self, fileId: str) -> list[str]:
+        return [
+            parentId
+            for (parentId,) in self._connection.execute(
+                "SELECT parentId FROM parents WHERE fileId = ?", (fileId,)
+            )
+        ]
+
+    def _resolveId(self, fileId: str) -> str:
+        if fileId == "root":
+            rootId = self._getState("rootId")
+            if rootId is not None:
+                return rootId
+        return fileId
+
+    def getPayload(self, fileId: str) -> dict[str, Any] | None:
+        with self._lock:
+            fileId = self._resolveId(fileId)
+            row = self._connection.execute(
+                f"SELECT {', '.join(_columnNames)} FROM files WHERE id = ?", (fileId,)
+            ).fetchone()
+            if row is None:
+                return None
+            return self._toPayload(row, self._getParents(fileId))
+
+    def get(self, fileId: str) -> File | None:
+        payload = self.getPayload(fileId)
+        return None if payload is None else File(**payload)
+
+    def childrenPayloads(
+        self, folderId: str, name: str | None = None
+    ) -> list[dict[str, Any]]:
+        query = (
+            f"SELECT {', '.join('f.' + c for c in _columnNames)} FROM parents p "
+            "JOIN files f ON f.id = p.fileId WHERE p.parentId = ?"
+        )
+        with self._lock:
+            parameters = [self._resolveId(folderId)]
+            if name is not None:
+                query += " AND f.name = ?"
+                parameters.append(name)
+            rows = self._connection.execute(query, parameters).fetchall()
+            return [self._toPayload(row, self._getParents(row[0])) for row in rows]
+
+    def children(self, folderId: str, name: str | None = None) -> list[File]:
+        return [File(**payload) for payload in self.childrenPayloads(folderId, name)]
+
+    def getDrivePathId(self, drivePath: str) -> str:
+        fileId, parts = processDrivePath(drivePath)
+        with self._lock:
+            fileId = self._resolveId(fileId)
+            for part in parts:
+                files = self._connection.execute(
+                    "SELECT p.fileId FROM parents p JOIN files f ON f.id = p.fileId "
+                    "WHERE p.parentId = ? AND f.name = ? LIMIT 2",
+                    (fileId, part),
+                ).fetchall()
+                if len(files) != 1:
+                    raise ValueError(
+                        "Found multiple files with given name"
+                        if len(files) > 1
+                        else "Found no files with given name"
+                    )
+                fileId = files[0][0]
+        return fileId
@@ -0,0 +1,176 @@
+from gService.gColumns import gColumns
+from .data import Change, File
+import threading
+import time
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Any, Callable, Sequence
+
+if TYPE_CHECKING:
+    from .Changes import gDriveChanges
+
+
+class _gPathNode:
+    __slots__ = ("name", "fileId", "parent", "children", "expires")
+
+    def __init__(
+        self,
+        name: str,
+        fileId: str | None,
+        parent: "_gPathNode | None",
+        expires: float,
+    ) -> None:
+        self.name = name
+        self.fileId = fileId
+        self.parent = parent
+        self.children: dict[str, _gPathNode] = {}
+        self.expires = expires
+
+
+class gPathCache:
+    def __init__(
+        self,
+        maxEntries: int = 10000,
+        maxAge: float | None = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        if maxEntries < 1:
+            raise ValueError("Cache has to hold at least 1 entry")
+        self._maxEntries = maxEntries
+        self._maxAge = maxAge
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._roots: dict[str, _gPathNode] = {}
+        self._entries: OrderedDict[_gPathNode, None] = OrderedDict()
+        self._byId: dict[str, set[_gPathNode]] = {}
+        self._byName: dict[str, set[_gPathNode]] = {}
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+        self.invalidations = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _expires(self) -> float:
+        return float("inf") if self._maxAge is None else self._clock() + self._maxAge
+
+    def _remove(self, node: _gPathNode) -> int:
+        removed = 1
+        for child in list(node.children.values()):
+            removed += self._remove(child)
+        parent = node.parent
+        if parent is not None:
+            del parent.children[node.name]
+            if parent.parent is None and len(parent.children) == 0:
+                del self._roots[parent.name]
+        del self._entries[node]
+        self._byName[node.name].discard(node)
+        if len(self._byName[node.name]) == 0:
+            del self._byName[node.name]
+        if node.fileId is not None:
+            self._byId[node.fileId].discard(node)
+            if len(self._byId[node.fileId]) == 0:
+                del self._byId[node.fileId]
+        return removed
+
+    def get(self, prefix: str, parts: Sequence[str]) -> tuple[str, int]:
+        with self._lock:
+            node = self._roots.get(prefix)
+            fileId = prefix
+            path: list[_gPathNode] = []
+            if node is not None:
+                now = self._clock()
+                for part in parts:
+                    child = node.children.get(part)
+                    if child is None:
+                        break
+                    if child.expires <= now:
+                        self.expirations += self._remove(child)
+                        break
+                    if child.fileId is None:
+                        self.hits += 1
+                        raise ValueError("Found no files with given name")
+                    path.append(child)
+                    node = child
+                    fileId = child.fileId
+            for node in reversed(path):
+                self._entries.move_to_end(node)
+            if len(path) == len(parts):
+                self.hits += 1
+            else:
+                self.misses += 1
+            return fileId, len(path)
+
+    def _put(self, prefix: str, parts: Sequence[str], fileId: str | None) -> None:
+        with self._lock:
+            node = self._roots.get(prefix)
+            for part in parts:
+                node = node.children.get(part) if node is not None else None
+            if node is not None:
+                self._remove(node)
+            node = self._roots.get(prefix)
+            if node is None:
+                node = self._roots[prefix] = _gPathNode(prefix, prefix, None, 0)
+            path: list[_gPathNode] = []
+            for part in parts[:-1]:
+                child = node.children.get(part)
+                if child is None or child.fileId is None:
+                    if len(node.children) == 0 and node.parent is None:
+                        del self._roots[prefix]
+                    return
+                path.append(child)
+                node = child
+            name = parts[-1]
+            child = node.children[name] = _gPathNode(
+                name, fileId, node, self._expires()
+            )
+            self._entries[child] = None
+            for node in reversed(path):
+                self._entries.move_to_end(node)
+            self._byName.setdefault(name, set()).add(child)
+            if fileId is not None:
+                self._byId.setdefault(fileId, set()).add(child)
+            while len(self._entries) > self._maxEntries:
+                self.evictions += self._remove(next(iter(self._entries)))
+
+    def set(self, prefix: str, parts: Sequence[str], fileId: str) -> None:
+        self._put(prefix, parts, fileId)
+
+    def setMissing(self, prefix: str, parts: Sequence[str]) -> None:
+        self._put(prefix, parts, None)
+
+    def invalidate(self, fileId: str | None = None, name: str | None = None) -> None:
+        with self._lock:
+            nodes = set(self._byId.get(fileId, ())) if fileId is not None else set()
+            if name is not None:
+                nodes.update(self._byName.get(name, ()))
+            for node in nodes:
+                if node in self._entries:
+                    self.invalidations += self._remove(node)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._roots.clear()
+            self._entries.clear()
+            self._byId.clear()
+            self._byName.clear()
+
+    def sync(self, changes: "gDriveChanges", pageToken: str, **kwargs: Any) -> str:
+        pages = changes.iterate(
+            changes.list,
+            Change.fileId,
+            File(File.name),
+            pageFields=["newStartPageToken"],
+            pageToken=pageToken,
+            pageSize=1000,
+            prefetch=False,
+            **kwargs,
+        )
+        page = None
+        for page in pages.pages(view=True):
+            rows = gColumns(Change, ["fileId", "file.name"])
+            rows.extend(pages.items(page))
+            for row in rows:
+                self.invalidate(row.fileId, row["file.name"])
+        return page.newStartPageToken if page is not None else pageToken
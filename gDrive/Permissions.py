@@ -1,9 +1,10 @@
-from gService.gResourceManager import gResourceManager
+from gService.gResourceManager import gResourceManager, resourceMethod
 from .data import Permission, Permissions
 from .data.helpers import IncludePermissionsForView
 
 
 class gDrivePermissions(gResourceManager):
+    @resourceMethod
     def create(
         self,
         permission: Permission,
@@ -17,6 +18,7 @@ class gDrivePermissions(gResourceManager):
     ) -> Permission:
         return self._getResource("executeOnlyOnce", body="permission")
 
+    @resourceMethod
     def delete(
         self,
         fileId: str,
@@ -26,6 +28,7 @@ class gDrivePermissions(gResourceManager):
     ) -> None:
         return self._getResource("checkForErrors")
 
+    @resourceMethod
     def get(
         self,
         fileId: str,
@@ -35,6 +38,7 @@ class gDrivePermissions(gResourceManager):
     ) -> Permission:
         return self._getResource("execute")
 
+    @resourceMethod
     def list(
         self,
         fileId: str,
@@ -46,6 +50,7 @@ class gDrivePermissions(gResourceManager):
     ) -> Permissions.List:
         return self._getResource("execute")
 
+    @resourceMethod
     def update(
         self,
         permission: Permission,
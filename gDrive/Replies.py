@@ -1,14 +1,17 @@
-from gService.gResourceManager import gResourceManager
+from gService.gResourceManager import gResourceManager, resourceMethod
 from .data import Reply, Replies
 
 
 class gDriveReplies(gResourceManager):
+    @resourceMethod
     def create(self, reply: Reply, fileId: str, commentId: str) -> Reply:
         return self._getResource("executeOnlyOnce", body="reply")
 
+    @resourceMethod
     def delete(self, fileId: str, commentId: str, replyId: str) -> None:
         return self._getResource("checkForErrors")
 
+    @resourceMethod
     def get(
         self,
         fileId: str,
@@ -18,6 +21,7 @@ class gDriveReplies(gResourceManager):
     ) -> Reply:
         return self._getResource("execute")
 
+    @resourceMethod
     def list(
         self,
         fileId: str,
@@ -28,5 +32,6 @@ class gDriveReplies(gResourceManager):
     ) -> Replies.List:
         return self._getResource("execute")
 
+    @resourceMethod
     def update(self, reply: Reply, fileId: str, commentId: str, replyId: str) -> Reply:
         return self._getResource("executeOnlyOnce", body="reply")
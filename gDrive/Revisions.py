@@ -1,20 +1,24 @@
-from gService.gResourceManager import gResourceManager
+from gService.gResourceManager import gResourceManager, resourceMethod
 from .data import Revision, Revisions
 
 
 class gDriveRevisions(gResourceManager):
+    @resourceMethod
     def delete(self, fileId: str, revisionId: str) -> None:
         return self._getResource("checkForErrors")
 
+    @resourceMethod
     def get(
         self, fileId: str, revisionId: str, acknowledgeAbuse: bool | None = None
     ) -> Revision:
         return self._getResource("execute")
 
+    @resourceMethod
     def list(
         self, fileId: str, pageSize: int | None = None, pageToken: str | None = None
     ) -> Revisions.List:
         return self._getResource("execute")
 
+    @resourceMethod
     def update(self, revision: Revision, fileId: str, revisionId: str) -> Revision:
         return self._getResource("executeOnlyOnce", body="revision")
@@ -0,0 +1,94 @@
+from gService.gColumns import gColumns, gColumnsRow
+from .data import File
+from .Files import TreeEntry, TreeResult
+from .query import BridgeTerm
+from .utils import FolderMimeType, processDrivePath
+from array import array
+from collections import deque
+from typing import Generator
+
+
+class gDriveSnapshot:
+    def __init__(self, files: gColumns[File], rootId: str) -> None:
+        self.files = files
+        self.rootId = rootId
+        self._index: dict[str, int] = {}
+        strings = files.strings.strings
+        for row, code in enumerate(files.codes("id")):
+            if code >= 0:
+                self._index[strings[code]] = row
+        parents = files.codes("parents")
+        offsets = files.offsets("parents")
+        pairs = sorted(
+            (parentCode, row)
+            for row in range(len(files))
+            for parentCode in parents[offsets[row] : offsets[row + 1]]
+        )
+        self._children = array("q", [row for _, row in pairs])
+        self._childRanges: dict[str, tuple[int, int]] = {}
+        start = 0
+        for i in range(1, len(pairs) + 1):
+            if i == len(pairs) or pairs[i][0] != pairs[start][0]:
+                self._childRanges[strings[pairs[start][0]]] = (start, i)
+                start = i
+
+    def __len__(self) -> int:
+        return len(self.files)
+
+    def __contains__(self, fileId: str) -> bool:
+        return fileId in self._index
+
+    def _resolveId(self, fileId: str) -> str:
+        return self.rootId if fileId == "root" else fileId
+
+    def Get(self, fileId: str) -> gColumnsRow[File]:
+        return self.files[self._index[self._resolveId(fileId)]]
+
+    def Children(self, folderId: str) -> list[gColumnsRow[File]]:
+        start, end = self._childRanges.get(self._resolveId(folderId), (0, 0))
+        return [self.files[row] for row in self._children[start:end]]
+
+    def Filter(self, q: BridgeTerm) -> list[gColumnsRow[File]]:
+        q = q.Simplify()
+        return [f for f in self.files if q.Evaluate(f)]
+
+    def GetDrivePathId(self, drivePath: str) -> str:
+        fileId, parts = processDrivePath(drivePath)
+        fileId = self._resolveId(fileId)
+        for part in parts:
+            files = [f.id for f in self.Children(fileId) if f.name == part]
+            if len(files) != 1:
+                raise ValueError(
+                    "Found multiple files with given name"
+                    if len(files) > 1
+                    else "Found no files with given name"
+                )
+            fileId = files[0]
+        return fileId
+
+    def IterTreeId(self, folderId: str) -> Generator[TreeEntry, None, None]:
+        folders = deque([self._resolveId(folderId)])
+        while len(folders) > 0:
+            parentId = folders.popleft()
+            for f in self.Children(parentId):
+                if f.mimeType == FolderMimeType:
+                    folders.append(f.id)
+                yield parentId, f.id, f.name, f.mimeType
+
+    def IterTree(self, drivePath: str) -> Generator[TreeEntry, None, None]:
+        return self.IterTreeId(self.GetDrivePathId(drivePath))
+
+    def TreeId(self, folderId: str) -> TreeResult:
+        folderId = self._resolveId(folderId)
+        result: TreeResult = {}
+        folders: dict[str, TreeResult] = {folderId: result}
+        for parentId, fileId, name, mimeType in self.IterTreeId(folderId):
+            if mimeType == FolderMimeType:
+                folders[fileId] = {}
+                folders[parentId][(fileId, name)] = folders[fileId]
+            else:
+                folders[parentId][(fileId, name)] = None
+        return result
+
+    def Tree(self, drivePath: str) -> TreeResult:
+        return self.TreeId(self.GetDrivePathId(drivePath))
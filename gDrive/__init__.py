@@ -1,20 +1,29 @@
 from gService import gCredentials, gService
-from gService.gData import executeGDataResource
+from gService.gDiscovery import gDiscoveryCache, defaultDiscoveryCache
+from functools import cached_property
+from gService.gData import executeGDataResource, gDeferredScope
 from .About import gDriveAbout
 from .Changes import gDriveChanges
+from .ChangeStream import gChangeStream, gFileCheckpoint, gMemoryCheckpoint
 from .Channels import gDriveChannels
 from .Comments import gDriveComments
 from .Drives import gDriveDrives
 from .Files import gDriveFiles
+from .PathCache import gPathCache
 from .Permissions import gDrivePermissions
 from .Replies import gDriveReplies
 from .Revisions import gDriveRevisions
-from .query import FileQueryTerm, SharedDriveQueryTerm
+from .query import FileQueryTerm, Parameter, SharedDriveQueryTerm
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from googleapiclient.model import BaseModel
 
 
 fq = FileQueryTerm
 sdq = SharedDriveQueryTerm
 execute = executeGDataResource
+defer = gDeferredScope
 
 
 class Scopes:
@@ -34,14 +43,68 @@ class Scopes:
 
 
 class gDrive(gService):
-    def __init__(self, credentials: gCredentials):
-        super().__init__(credentials, "drive", "v3")
-        self.about = gDriveAbout(self._resource.about())
-        self.changes = gDriveChanges(self._resource.changes())
-        self.channels = gDriveChannels(self._resource.channels())
-        self.comments = gDriveComments(self._resource.comments())
-        self.drives = gDriveDrives(self._resource.drives())
-        self.files = gDriveFiles(self._resource.files())
-        self.permissions = gDrivePermissions(self._resource.permissions())
-        self.replies = gDriveReplies(self._resource.replies())
-        self.revisions = gDriveRevisions(self._resource.revisions())
+    def __init__(
+        self,
+        credentials: gCredentials,
+        model: "BaseModel | None" = None,
+        discoveryCache: gDiscoveryCache = defaultDiscoveryCache,
+        maxConnections: int | None = None,
+        clientOptions: dict[str, Any] | None = None,
+    ):
+        super().__init__(
+            credentials,
+            "drive",
+            "v3",
+            model,
+            discoveryCache,
+            maxConnections,
+            clientOptions,
+        )
+
+    @cached_property
+    def about(self) -> gDriveAbout:
+        return gDriveAbout(self._resource.about())
+
+    @cached_property
+    def changes(self) -> gDriveChanges:
+        return gDriveChanges(self._resource.changes())
+
+    @cached_property
+    def channels(self) -> gDriveChannels:
+        return gDriveChannels(self._resource.channels())
+
+    @cached_property
+    def comments(self) -> gDriveComments:
+        return gDriveComments(self._resource.comments())
+
+    @cached_property
+    def drives(self) -> gDriveDrives:
+        return gDriveDrives(self._resource.drives())
+
+    @cached_property
+    def files(self) -> gDriveFiles:
+        return gDriveFiles(self._resource.files())
+
+    @cached_property
+    def permissions(self) -> gDrivePermissions:
+        return gDrivePermissions(self._resource.permissions())
+
+    @cached_property
+    def replies(self) -> gDriveReplies:
+        return gDriveReplies(self._resource.replies())
+
+    @cached_property
+    def revisions(self) -> gDriveRevisions:
+        return gDriveRevisions(self._resource.revisions())
+
+
+def __getattr__(name: str) -> Any:
+    if name == "AsyncgDrive":
+        from .Async import AsyncgDrive
+
+        return AsyncgDrive
+    if name == "gDriveIndex":
+        from .Index import gDriveIndex
+
+        return gDriveIndex
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,5 +1,7 @@
 import datetime
-from typing import Any, Callable, Generic, Literal, TypeVar
+import operator
+import re
+from typing import Any, Callable, Generic, Iterable, Literal, TypeVar
 
 T = TypeVar("T")
 
@@ -7,11 +9,15 @@ T = TypeVar("T")
 class QueryTerm:
     @staticmethod
     def Not(q: "BridgeTerm") -> "BridgeTerm":
-        return BridgeTerm(f"not ({q})")
+        return NotTerm(q)
 
     def __call__(self, queryTerm: str) -> "AllOperators[Any]":
         return AllOperators(queryTerm)
 
+    @staticmethod
+    def prepare(q: "BridgeTerm") -> "PreparedQuery":
+        return PreparedQuery(q)
+
     def __getattr__(self, __name: str) -> Any:
         vartype = self.__annotations__[__name]
         return vartype(__name)
@@ -27,6 +33,15 @@ class BridgeTerm:
     def __repr__(self) -> str:
         return self.__str__()
 
+    def _key(self) -> Any:
+        return self._value
+
+    def __eq__(self, value: Any) -> bool:
+        return isinstance(value, BridgeTerm) and self._key() == value._key()
+
+    def __hash__(self) -> int:
+        return hash(self._key())
+
     def __invert__(self) -> "BridgeTerm":
         return QueryTerm.Not(self)
 
@@ -37,28 +52,254 @@ class BridgeTerm:
         return self.Or(q)
 
     def _and_or(self, op: Literal["and", "or"], *q: "BridgeTerm") -> "BridgeTerm":
-        terms = map(lambda x: f"({x})", (self, *q))
-        return BridgeTerm(f" {op} ".join(terms))
+        return BooleanTerm(op, (self, *q))
 
     def And(self, *q: "BridgeTerm") -> "BridgeTerm":
         return self._and_or("and", *q)
 
     def Or(self, *q: "BridgeTerm") -> "BridgeTerm":
         return self._and_or("or", *q)
-    
+
+    def Simplify(self) -> "BridgeTerm":
+        return self
+
+    def Evaluate(self, file: Any) -> bool:
+        raise ValueError(f'Query "{self}" can not be evaluated locally')
+
+    def cacheKey(self) -> str:
+        return repr(self.Simplify())
+
+
+class ConstantTerm(BridgeTerm):
+    def __init__(self, value: bool):
+        self.value = value
+
+    def __str__(self) -> str:
+        raise ValueError(f"Query is always {'true' if self.value else 'false'}")
+
+    def __repr__(self) -> str:
+        return f"ConstantTerm({self.value})"
+
+    def _key(self) -> Any:
+        return self.value
+
+    def Evaluate(self, file: Any) -> bool:
+        return self.value
+
+
+class NotTerm(BridgeTerm):
+    def __init__(self, term: BridgeTerm):
+        self.term = term
+
+    def __str__(self) -> str:
+        return f"not ({self.term})"
+
+    def _key(self) -> Any:
+        return ("not", self.term._key())
+
+    def Simplify(self) -> BridgeTerm:
+        term = self.term.Simplify()
+        if isinstance(term, NotTerm):
+            return term.term
+        if isinstance(term, ConstantTerm):
+            return ConstantTerm(not term.value)
+        return NotTerm(term)
+
+    def Evaluate(self, file: Any) -> bool:
+        return not self.term.Evaluate(file)
+
+
+class BooleanTerm(BridgeTerm):
+    def __init__(self, op: Literal["and", "or"], terms: Iterable[BridgeTerm]):
+        self.op = op
+        self.terms = tuple(terms)
+
+    def __str__(self) -> str:
+        return f" {self.op} ".join([f"({x})" for x in self.terms])
+
+    def _key(self) -> Any:
+        return (self.op, tuple(x._key() for x in self.terms))
+
+    def Simplify(self) -> BridgeTerm:
+        decisive = self.op == "or"
+        operands: dict[Any, BridgeTerm] = {}
+        stack = [x.Simplify() for x in reversed(self.terms)]
+        while len(stack) > 0:
+            term = stack.pop()
+            if isinstance(term, BooleanTerm) and term.op == self.op:
+                stack.extend(reversed(term.terms))
+            elif isinstance(term, ConstantTerm):
+                if term.value == decisive:
+                    return term
+            else:
+                operands.setdefault(term._key(), term)
+        for term in operands.values():
+            if not isinstance(term, NotTerm):
+                continue
+            inner = term.term
+            if isinstance(inner, BooleanTerm) and inner.op == self.op:
+                keys = [x._key() for x in inner.terms]
+            else:
+                keys = [inner._key()]
+            if all(key in operands for key in keys):
+                return ConstantTerm(decisive)
+        if len(operands) == 0:
+            return ConstantTerm(not decisive)
+        if len(operands) == 1:
+            return next(iter(operands.values()))
+        terms = sorted(operands.items(), key=lambda x: repr(x[0]))
+        return BooleanTerm(self.op, [x for _, x in terms])
+
+    def Evaluate(self, file: Any) -> bool:
+        if self.op == "and":
+            return all(x.Evaluate(file) for x in self.terms)
+        return any(x.Evaluate(file) for x in self.terms)
+
+
+def _getField(file: Any, name: str) -> Any:
+    if isinstance(file, dict):
+        return file.get(name)
+    return getattr(file, name, None)
+
+
+def _tokens(value: str) -> list[str]:
+    return [token for token in re.split(r"[\W_]+", value.lower()) if token != ""]
+
+
+def _comparable(value: Any, operand: Any) -> tuple[Any, Any]:
+    if type(operand) is datetime.datetime:
+        if type(value) is str:
+            value = datetime.datetime.fromisoformat(value)
+        if operand.tzinfo is None:
+            operand = operand.replace(tzinfo=datetime.timezone.utc)
+        if value.tzinfo is None:
+            value = value.replace(tzinfo=datetime.timezone.utc)
+    elif type(operand) is int:
+        value = int(value)
+    return value, operand
+
+
+class ConditionTerm(BridgeTerm):
+    RemoteFields = {
+        "fullText",
+        "writers",
+        "readers",
+        "labels",
+        "sharedWithMe",
+        "visibility",
+        "properties",
+        "appProperties",
+    }
+
+    Comparisons: dict[str, Callable[[Any, Any], bool]] = {
+        "Eq": operator.eq,
+        "Neq": operator.ne,
+        "Gt": operator.gt,
+        "Geq": operator.ge,
+        "Lt": operator.lt,
+        "Leq": operator.le,
+    }
+
+    def __init__(self, value: str, field: str, op: str, operand: Any):
+        super().__init__(value)
+        self.field = field
+        self.op = op
+        self.operand = operand
+
+    def Evaluate(self, file: Any) -> bool:
+        if self.field in self.RemoteFields:
+            return super().Evaluate(file)
+        value = _getField(file, self.field)
+        if self.op == "IsNull":
+            return value is None
+        if self.op == "IsNotNull":
+            return value is not None
+        if self.op == "Include":
+            return value is not None and any(
+                (v if type(v) is str else _getField(v, "emailAddress"))
+                == self.operand
+                for v in value
+            )
+        if value is None:
+            return self.op == "Neq"
+        if self.op == "Contains":
+            if self.field == "name":
+                tokens = _tokens(self.operand)
+                if len(tokens) == 0:
+                    return self.operand.lower() in value.lower()
+                names = _tokens(value)
+                return all(any(n.startswith(t) for n in names) for t in tokens)
+            return self.operand.lower() in value.lower()
+        if self.op == "StartsWith":
+            return value.startswith(self.operand)
+        return self.Comparisons[self.op](*_comparable(value, self.operand))
+
 
 class NotAValue:
     pass
 
 
+def escapeValue(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("'", "\\'")
+
+
+class Parameter:
+    def __init__(self, name: str):
+        if not name.isidentifier():
+            raise ValueError(f'Invalid parameter name "{name}"')
+        self.name = name
+
+    def marker(self, escape: bool = True) -> str:
+        return f"\x00{self.name}\x00" if escape else f"\x00{self.name}:raw\x00"
+
+    def __repr__(self) -> str:
+        return f"Parameter({self.name!r})"
+
+
+class _PreparedValue:
+    __slots__ = ("value",)
+
+    def __init__(self, value: Any):
+        self.value = value
+
+    def __format__(self, spec: str) -> str:
+        return Operator._processValue(self.value, spec != "raw")
+
+
+class PreparedQuery:
+    _markers = re.compile("\x00([^\x00:]+)(:raw)?\x00")
+
+    def __init__(self, q: BridgeTerm):
+        text = str(q).replace("{", "{{").replace("}", "}}")
+        self.parameters = tuple(
+            dict.fromkeys(name for name, _ in self._markers.findall(text))
+        )
+        self.template = self._markers.sub(r"{\1\2}", text)
+        self._format = self.template.format
+
+    def __repr__(self) -> str:
+        return f"PreparedQuery({self.template!r})"
+
+    def __call__(self, **values: Any) -> str:
+        if values.keys() != set(self.parameters):
+            missing = [k for k in self.parameters if k not in values]
+            unknown = [k for k in values if k not in self.parameters]
+            raise ValueError(
+                f"Invalid query parameters, missing: {missing}, unknown: {unknown}"
+            )
+        return self._format(**{k: _PreparedValue(v) for k, v in values.items()})
+
+
 class Operator:
     def __init__(self, queryTerm: str):
         self._queryTerm = queryTerm
 
     @staticmethod
-    def _processValue(value: Any) -> str:
+    def _processValue(value: Any, escape: bool = True) -> str:
         if type(value) is str:
-            return value
+            return escapeValue(value) if escape else value
+        elif type(value) is Parameter:
+            return value.marker(escape)
         elif type(value) is int:
             return str(value)
         elif type(value) is bool:
@@ -72,29 +313,31 @@ class Operator:
 
         def func(value: Any = NotAValue):
             if value is NotAValue:
-                return BridgeTerm(pFunction())
-            pValue = Operator._processValue(value)
-            return BridgeTerm(pFunction(pValue))
+                return ConditionTerm(pFunction(), self._queryTerm, operator, value)
+            pValue = Operator._processValue(value, operator != "Has")
+            return ConditionTerm(
+                pFunction(pValue), self._queryTerm, operator, value
+            )
 
         return func
 
 
 class ContainsOperator(Operator, Generic[T]):
-    Contains: Callable[[T], BridgeTerm]
+    Contains: Callable[[T | Parameter], BridgeTerm]
 
     def _Contains(self, value: str) -> str:
         return f"{self._queryTerm} contains '{value}'"
 
 
 class IncludeOperator(Operator, Generic[T]):
-    Include: Callable[[T], BridgeTerm]
+    Include: Callable[[T | Parameter], BridgeTerm]
 
     def _Include(self, value: str) -> str:
         return f"'{value}' in {self._queryTerm}"
 
 
 class HasOperator(Operator, Generic[T]):
-    Has: Callable[[T], BridgeTerm]
+    Has: Callable[[T | Parameter], BridgeTerm]
 
     def _Has(self, value: str) -> str:
         return f"{self._queryTerm} has {value}"
@@ -107,9 +350,9 @@ class EqOperator(Operator, Generic[T]):
     def __ne__(self, value: Any) -> bool:
         raise NotImplementedError()
 
-    Eq: Callable[[T], BridgeTerm]
+    Eq: Callable[[T | Parameter], BridgeTerm]
 
-    Neq: Callable[[T], BridgeTerm]
+    Neq: Callable[[T | Parameter], BridgeTerm]
 
     def _Eq(self, value: str) -> str:
         return f"{self._queryTerm} = '{value}'"
@@ -119,21 +362,21 @@ class EqOperator(Operator, Generic[T]):
 
 
 class OrderOperator(Operator, Generic[T]):
-    __gt__: Callable[[T], BridgeTerm]
+    __gt__: Callable[[T | Parameter], BridgeTerm]
 
-    __ge__: Callable[[T], BridgeTerm]
+    __ge__: Callable[[T | Parameter], BridgeTerm]
 
-    __lt__: Callable[[T], BridgeTerm]
+    __lt__: Callable[[T | Parameter], BridgeTerm]
 
-    __le__: Callable[[T], BridgeTerm]
+    __le__: Callable[[T | Parameter], BridgeTerm]
 
-    Gt: Callable[[T], BridgeTerm]
+    Gt: Callable[[T | Parameter], BridgeTerm]
 
-    Geq: Callable[[T], BridgeTerm]
+    Geq: Callable[[T | Parameter], BridgeTerm]
 
-    Lt: Callable[[T], BridgeTerm]
+    Lt: Callable[[T | Parameter], BridgeTerm]
 
-    Leq: Callable[[T], BridgeTerm]
+    Leq: Callable[[T | Parameter], BridgeTerm]
 
     def ___gt__(self, value: str) -> str:
         return self._Gt(value)
@@ -173,7 +416,7 @@ class IsNullOperator(Operator, Generic[T]):
 
 
 class StartsWithOperator(Operator, Generic[T]):
-    StartsWith: Callable[[T], BridgeTerm]
+    StartsWith: Callable[[T | Parameter], BridgeTerm]
 
     def _StartsWith(self, value: str) -> str:
         return f"{self._queryTerm} starts with '{value}'"
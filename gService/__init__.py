@@ -1,19 +1,69 @@
 from .gCredentials import gCredentials
 from .gResourceManager import gResourceManager
-from googleapiclient.discovery import build
-from typing import Any
+from .gBatch import gBatchScope
+from .gDiscovery import gDiscoveryCache, defaultDiscoveryCache
+from .gTransport import gHttpPool, createHttp
+from functools import partial
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from googleapiclient.model import BaseModel
 
 
 class gService(gResourceManager):
     def __init__(
-        self, credentials: gCredentials, serviceName: str, version: str
+        self,
+        credentials: gCredentials,
+        serviceName: str,
+        version: str,
+        model: "BaseModel | None" = None,
+        discoveryCache: gDiscoveryCache = defaultDiscoveryCache,
+        maxConnections: int | None = None,
+        clientOptions: dict[str, Any] | None = None,
     ) -> None:
+        if model is None:
+            from .gModel import gJsonModel
+
+            model = gJsonModel()
+        kwargs: dict[str, Any] = {"model": model, "client_options": clientOptions}
         c = credentials.getStoredCredentials()
-        if c is not None:
-            resource: Any = build(serviceName, version, credentials=c)
-        else:
+        if c is None:
             k = credentials.getStoredKey()
             if k is None:
                 raise ValueError("Got invalid credentials")
-            resource: Any = build(serviceName, version, developerKey=k)
+            kwargs["developerKey"] = k
+        self.httpPool: gHttpPool | None = None
+        if maxConnections is not None:
+            self.httpPool = gHttpPool(partial(createHttp, c), maxConnections, c)
+            kwargs["http"] = self.httpPool
+        elif c is not None:
+            kwargs["credentials"] = c
+        resource = self._build(serviceName, version, discoveryCache, **kwargs)
         super().__init__(resource)
+
+    @staticmethod
+    def _build(
+        serviceName: str,
+        version: str,
+        discoveryCache: gDiscoveryCache,
+        **kwargs: Any,
+    ) -> Any:
+        from googleapiclient.discovery import build, build_from_document
+
+        document = discoveryCache.getDocument(serviceName, version)
+        if document is not None:
+            return build_from_document(document, **kwargs)
+        return build(
+            serviceName,
+            version,
+            cache=discoveryCache,
+            static_discovery=False,
+            **kwargs,
+        )
+
+    def batch(
+        self, maxBatchSize: int = gBatchScope.MaxBatchSize, raiseErrors: bool = True
+    ) -> gBatchScope:
+        return gBatchScope(
+            self._resource.new_batch_http_request, maxBatchSize, raiseErrors
+        )
@@ -0,0 +1,191 @@
+import asyncio
+from .gData import (
+    gBaseDictData,
+    gBaseObjectData,
+    gDataclass,
+    gDictData,
+)
+from .gPages import gPages
+from .gResourceManager import gResourceManager
+from types import GeneratorType
+from typing import (
+    Any,
+    AsyncGenerator,
+    Callable,
+    Generator,
+    Generic,
+    Iterator,
+    Self,
+    Sequence,
+    TypeVar,
+    cast,
+)
+
+T = TypeVar("T", bound=gDataclass)
+K = TypeVar("K")
+M = TypeVar("M", bound=gResourceManager)
+
+_exhausted = object()
+
+
+class gAsyncRunner:
+    def __init__(self, maxConcurrency: int = 10) -> None:
+        if maxConcurrency < 1:
+            raise ValueError("Concurrency has to be at least 1")
+        self.maxConcurrency = maxConcurrency
+        self._semaphore = asyncio.Semaphore(maxConcurrency)
+
+    async def run(
+        self, function: Callable[..., Any], *args: Any, **kwargs: Any
+    ) -> Any:
+        async with self._semaphore:
+            return await asyncio.to_thread(function, *args, **kwargs)
+
+    async def stream(
+        self, generator: Generator[Any, Any, Any]
+    ) -> AsyncGenerator[Any, None]:
+        pending: asyncio.Future[Any] | None = None
+        try:
+            while True:
+                pending = asyncio.ensure_future(self.run(next, generator, _exhausted))
+                value = await asyncio.shield(pending)
+                if value is _exhausted:
+                    return
+                yield value
+        finally:
+            if pending is not None and not pending.done():
+                await asyncio.wait([pending])
+            generator.close()
+
+    def wrap(self, value: Any) -> Any:
+        if isinstance(value, gBaseObjectData):
+            return gAsyncData(value, self)
+        if isinstance(value, gDictData):
+            return gAsyncDictData(value, self)
+        if isinstance(value, gBaseDictData):
+            return gAsyncListData(value, self)
+        if isinstance(value, GeneratorType):
+            return self.stream(value)
+        return value
+
+
+class gAsyncData(Generic[T]):
+    def __init__(self, data: gBaseObjectData[T], runner: gAsyncRunner) -> None:
+        self.data = data
+        self._runner = runner
+
+    def __repr__(self) -> str:
+        return f"gAsyncData({self.data!r})"
+
+    def __getattr__(self, name: str) -> Any:
+        data = self.data
+        if not data._hasVariableAttribute(name):
+            raise AttributeError(name)
+        wrapper = data._getAttributeWrapperSafe(name)
+        if wrapper is not None:
+            return self._runner.wrap(wrapper)
+        if not data._hasAttribute(name):
+            raise RuntimeError(
+                f'Field "{name}" was not fetched, use "await fetch({name})" first'
+            )
+        return data._getAttributeUnchecked(name)
+
+    async def fetch(self, *fields: Any) -> "gAsyncData[T]":
+        await self._runner.run(self.data.getFields, *fields)
+        return self
+
+    async def execute(self) -> "gAsyncData[T]":
+        await self._runner.run(getattr(self.data, "execute"))
+        return self
+
+
+class gAsyncBaseDictData(Generic[K, T]):
+    def __init__(self, data: gBaseDictData[K, T], runner: gAsyncRunner) -> None:
+        self.data = data
+        self._runner = runner
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self.data!r})"
+
+    def _checkData(self) -> None:
+        if not self.data._hasData:
+            raise RuntimeError('Items were not fetched, use "await fetch()" first')
+
+    def __len__(self) -> int:
+        self._checkData()
+        return len(self.data)
+
+    def __getitem__(self, key: K) -> gAsyncData[T]:
+        self._checkData()
+        return gAsyncData(self.data[key], self._runner)
+
+    async def fetch(self, *fields: Any) -> Self:
+        if len(fields) > 0:
+            await self._runner.run(self.data.getFields, *fields)
+        else:
+            await self._runner.run(self.data._fetchAll)
+        return self
+
+
+class gAsyncListData(Generic[T], gAsyncBaseDictData[int, T]):
+    def __iter__(self) -> Iterator[gAsyncData[T]]:
+        return (self[i] for i in range(len(self)))
+
+
+class gAsyncDictData(Generic[K, T], gAsyncBaseDictData[K, T]):
+    def __contains__(self, key: K) -> bool:
+        self._checkData()
+        return key in self.data
+
+    def __iter__(self) -> Iterator[K]:
+        return iter(self.keys())
+
+    def keys(self) -> list[K]:
+        self._checkData()
+        return cast(gDictData[K, T], self.data).keys()
+
+    def values(self) -> list[gAsyncData[T]]:
+        return [self[k] for k in self.keys()]
+
+    def items(self) -> list[tuple[K, gAsyncData[T]]]:
+        return [(k, self[k]) for k in self.keys()]
+
+
+class gAsyncResourceManager(Generic[M]):
+    def __init__(self, manager: M, runner: gAsyncRunner) -> None:
+        self.manager = manager
+        self._runner = runner
+
+    def __getattr__(self, name: str) -> Callable[..., Any]:
+        method = getattr(self.manager, name)
+        if not callable(method) or name[0] == "_":
+            return method
+        runner = self._runner
+
+        async def call(*args: Any, **kwargs: Any) -> Any:
+            return runner.wrap(await runner.run(method, *args, **kwargs))
+
+        setattr(call, "syncMethod", method)
+        call.__name__ = name
+        call.__doc__ = method.__doc__
+        return call
+
+    async def iterate(
+        self,
+        method: Callable[..., Any],
+        *fields: Any,
+        itemsField: str | None = None,
+        pageFields: Sequence[str] = (),
+        **kwargs: Any,
+    ) -> AsyncGenerator[Any, None]:
+        pages: gPages[Any] = self.manager.iterate(
+            getattr(method, "syncMethod", method),
+            *fields,
+            itemsField=itemsField,
+            pageFields=pageFields,
+            prefetch=False,
+            **kwargs,
+        )
+        async for page in self._runner.stream(pages.pages()):
+            for item in pages.items(page):
+                yield self._runner.wrap(item)
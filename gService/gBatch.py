@@ -0,0 +1,118 @@
+from .gData import gDeferredScope, gRequestQueue, _requestQueue
+from typing import Any, Callable, Self
+
+
+class gBatchItemError:
+    def __init__(self, source: Any, exception: BaseException) -> None:
+        self.source = source
+        self.exception = exception
+
+    def __repr__(self) -> str:
+        return f"gBatchItemError({self.source!r}, {self.exception!r})"
+
+
+class gBatchError(Exception):
+    def __init__(self, errors: list[gBatchItemError]) -> None:
+        super().__init__(f"{len(errors)} batched request(s) failed")
+        self.errors = errors
+
+
+class gBatchScope(gDeferredScope, gRequestQueue):
+    MaxBatchSize = 100
+
+    def __init__(
+        self,
+        createBatch: Callable[[], Any],
+        maxBatchSize: int = MaxBatchSize,
+        raiseErrors: bool = True,
+    ) -> None:
+        super().__init__()
+        if not 0 < maxBatchSize <= self.MaxBatchSize:
+            raise ValueError(
+                f"Batch size has to be between 1 and {self.MaxBatchSize}"
+            )
+        self._createBatch = createBatch
+        self._maxBatchSize = maxBatchSize
+        self._raiseErrors = raiseErrors
+        self._queueToken: Any = None
+        self._requests: list[tuple[Any, Callable[[Any], None], Any]] = []
+        self.errors: list[gBatchItemError] = []
+        self.batches = 0
+
+    def addRequest(
+        self, request: Any, callback: Callable[[Any], None], source: Any
+    ) -> None:
+        self._requests.append((request, callback, source))
+
+    def _onResponse(
+        self,
+        callback: Callable[[Any], None],
+        source: Any,
+        response: Any,
+        exception: BaseException | None,
+    ) -> None:
+        if exception is None:
+            try:
+                callback(response)
+                return
+            except Exception as e:
+                exception = e
+        self.errors.append(gBatchItemError(source, exception))
+
+    def _executeBatch(
+        self, requests: list[tuple[Any, Callable[[Any], None], Any]]
+    ) -> None:
+        callbacks = {
+            str(i): (callback, source)
+            for i, (_, callback, source) in enumerate(requests)
+        }
+
+        def onResponse(requestId: str, response: Any, exception: Any) -> None:
+            self._onResponse(*callbacks.pop(requestId), response, exception)
+
+        try:
+            batch = self._createBatch()
+            for i, (request, _, _) in enumerate(requests):
+                batch.add(request, callback=onResponse, request_id=str(i))
+            self.batches += 1
+            batch.execute()
+        except Exception as e:
+            for _, source in callbacks.values():
+                self.errors.append(gBatchItemError(source, e))
+            raise
+
+    def flush(self) -> None:
+        failed = False
+        while len(self._requests) > 0:
+            requests = self._requests
+            self._requests = []
+            for i in range(0, len(requests), self._maxBatchSize):
+                try:
+                    self._executeBatch(requests[i : i + self._maxBatchSize])
+                except Exception:
+                    failed = True
+        if failed and self._raiseErrors:
+            raise gBatchError(self.errors)
+
+    def resolve(self) -> None:
+        token = _requestQueue.set(self)
+        try:
+            super().resolve()
+        finally:
+            _requestQueue.reset(token)
+        self.flush()
+
+    def __enter__(self) -> Self:
+        super().__enter__()
+        self._queueToken = _requestQueue.set(self)
+        return self
+
+    def __exit__(self, exc_type: Any, exc_val: Any, exc_tb: Any) -> None:
+        _requestQueue.reset(self._queueToken)
+        super().__exit__(exc_type, exc_val, exc_tb)
+        if exc_type is None:
+            self.flush()
+            if self._raiseErrors and len(self.errors) > 0:
+                raise gBatchError(self.errors)
+        else:
+            self._requests.clear()
@@ -0,0 +1,181 @@
+from .gData import gData, gResponseCacheBase, FieldsDict
+from .utils import estimateSize
+import json
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, cast
+
+
+CacheKey = tuple[str, str]
+
+
+def fieldsCover(cached: FieldsDict, requested: FieldsDict) -> bool:
+    cachedFields = cast(dict[Any, Any], cached)
+    if "*" in cachedFields:
+        return True
+    for k, v in cast(dict[Any, Any], requested).items():
+        if k not in cachedFields:
+            return False
+        cachedValue = cachedFields[k]
+        if cachedValue is None:
+            continue
+        if v is None or not fieldsCover(cachedValue, v):
+            return False
+    return True
+
+
+def keyDefault(value: Any) -> str:
+    cacheKey = getattr(value, "cacheKey", None)
+    return cacheKey() if callable(cacheKey) else str(value)
+
+
+class _gCacheEntry:
+    __slots__ = ("key", "fields", "parsedFields", "data", "size", "expires")
+
+    def __init__(
+        self, key: CacheKey, fields: str, data: Any, size: int, expires: float
+    ) -> None:
+        self.key = key
+        self.fields = fields
+        self.parsedFields = gData._convertGoogleFormatToFields(fields)
+        self.data = data
+        self.size = size
+        self.expires = expires
+
+
+class gResponseCache(gResponseCacheBase):
+    def __init__(
+        self,
+        maxBytes: int = 64 * 1024 * 1024,
+        defaultTtl: float = 60.0,
+        ttls: dict[str, float] | None = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._maxBytes = maxBytes
+        self._defaultTtl = defaultTtl
+        self._ttls = ttls if ttls is not None else {}
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[tuple[CacheKey, str], _gCacheEntry] = OrderedDict()
+        self._masks: dict[CacheKey, set[str]] = {}
+        self._ttlCache: dict[str, float] = {}
+        self.size = 0
+        self.hits = 0
+        self.supersetHits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+        self.invalidations = 0
+
+    def _getTtl(self, methodId: str) -> float:
+        ttl = self._ttlCache.get(methodId)
+        if ttl is None:
+            ttl = self._defaultTtl
+            prefix = ""
+            for k, v in self._ttls.items():
+                if (methodId == k or methodId.startswith(k + ".")) and len(k) > len(
+                    prefix
+                ):
+                    prefix, ttl = k, v
+            self._ttlCache[methodId] = ttl
+        return ttl
+
+    def getKey(self, request: Any, kwargs: dict[str, Any]) -> CacheKey | None:
+        methodId = getattr(request, "methodId", None)
+        if methodId is None or self._getTtl(methodId) <= 0:
+            return None
+        return methodId, json.dumps(kwargs, sort_keys=True, default=keyDefault)
+
+    def _remove(self, entry: _gCacheEntry) -> None:
+        del self._entries[(entry.key, entry.fields)]
+        masks = self._masks[entry.key]
+        masks.discard(entry.fields)
+        if len(masks) == 0:
+            del self._masks[entry.key]
+        self.size -= entry.size
+
+    def _isExpired(self, entry: _gCacheEntry, now: float) -> bool:
+        if entry.expires > now:
+            return False
+        self._remove(entry)
+        self.expirations += 1
+        return True
+
+    def _getEntry(self, key: CacheKey, fields: str) -> _gCacheEntry | None:
+        now = self._clock()
+        entry = self._entries.get((key, fields))
+        if entry is not None and not self._isExpired(entry, now):
+            return entry
+        if len(fields) == 0 or key not in self._masks:
+            return None
+        requested = gData._convertGoogleFormatToFields(fields)
+        for mask in list(self._masks[key]):
+            candidate = self._entries[(key, mask)]
+            if self._isExpired(candidate, now):
+                continue
+            if len(mask) > 0 and fieldsCover(candidate.parsedFields, requested):
+                return candidate
+        return None
+
+    def get(self, key: Any, fields: str) -> Any | None:
+        with self._lock:
+            entry = self._getEntry(key, fields)
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end((entry.key, entry.fields))
+            self.hits += 1
+            if entry.fields != fields:
+                self.supersetHits += 1
+            return entry.data
+
+    def put(self, key: Any, fields: str, data: Any) -> None:
+        size = estimateSize(data)
+        if size > self._maxBytes:
+            return
+        expires = self._clock() + self._getTtl(key[0])
+        with self._lock:
+            previous = self._entries.get((key, fields))
+            if previous is not None:
+                self._remove(previous)
+            self._entries[(key, fields)] = _gCacheEntry(key, fields, data, size, expires)
+            self._masks.setdefault(key, set()).add(fields)
+            self.size += size
+            while self.size > self._maxBytes:
+                _, entry = next(iter(self._entries.items()))
+                self._remove(entry)
+                self.evictions += 1
+
+    def invalidate(self, request: Any) -> None:
+        methodId = getattr(request, "methodId", None)
+        if methodId is None:
+            return self.clear()
+        self.invalidatePrefix(methodId.rsplit(".", 1)[0])
+
+    def invalidatePrefix(self, prefix: str) -> None:
+        with self._lock:
+            for entry in list(self._entries.values()):
+                if entry.key[0].startswith(prefix + "."):
+                    self._remove(entry)
+                    self.invalidations += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self.invalidations += len(self._entries)
+            self._entries.clear()
+            self._masks.clear()
+            self.size = 0
+
+    def stats(self) -> dict[str, int]:
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "bytes": self.size,
+                "hits": self.hits,
+                "supersetHits": self.supersetHits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "expirations": self.expirations,
+                "invalidations": self.invalidations,
+            }
@@ -0,0 +1,386 @@
+from .gData import (
+    gBaseData,
+    gBaseObjectData,
+    gDataclass,
+    gListData,
+    FieldsDict,
+    FieldDictStr,
+    dataclassToFieldsDict,
+    getSchema,
+)
+from abc import ABC, abstractmethod
+from array import array
+from typing import (
+    Any,
+    Generic,
+    Iterable,
+    Iterator,
+    Sequence,
+    TypeVar,
+    get_args,
+    get_origin,
+)
+
+T = TypeVar("T", bound=gDataclass)
+
+_missing = object()
+
+
+class gStringTable:
+    __slots__ = ("strings", "_codes")
+
+    def __init__(self) -> None:
+        self.strings: list[str] = []
+        self._codes: dict[str, int] = {}
+
+    def __len__(self) -> int:
+        return len(self.strings)
+
+    def encode(self, value: str) -> int:
+        code = self._codes.get(value)
+        if code is None:
+            code = len(self.strings)
+            self._codes[value] = code
+            self.strings.append(value)
+        return code
+
+    def find(self, value: str) -> int | None:
+        return self._codes.get(value)
+
+
+class gColumn(ABC):
+    @abstractmethod
+    def append(self, value: Any) -> None: ...
+
+    @abstractmethod
+    def appendMissing(self) -> None: ...
+
+    @abstractmethod
+    def get(self, index: int) -> Any: ...
+
+    @abstractmethod
+    def toNumpy(self, np: Any) -> Any: ...
+
+    @abstractmethod
+    def nbytes(self) -> int: ...
+
+    def __init__(self, name: str) -> None:
+        self.name = name
+        self.path = tuple(name.split("."))
+
+
+class gNumberColumn(gColumn):
+    def __init__(self, name: str, typecode: str, convert: type) -> None:
+        super().__init__(name)
+        self.values = array(typecode)
+        self.present = bytearray()
+        self._convert = convert
+
+    def append(self, value: Any) -> None:
+        self.values.append(self._convert(value))
+        self.present.append(1)
+
+    def appendMissing(self) -> None:
+        self.values.append(0)
+        self.present.append(0)
+
+    def get(self, index: int) -> Any:
+        return self.values[index] if self.present[index] else None
+
+    def toNumpy(self, np: Any) -> Any:
+        values = np.array(self.values)
+        if self.present.count(0) == 0:
+            return values
+        mask = np.frombuffer(self.present, np.uint8) == 0
+        return np.ma.masked_array(values, mask=mask)
+
+    def nbytes(self) -> int:
+        return self.values.itemsize * len(self.values) + len(self.present)
+
+
+class gBoolColumn(gColumn):
+    def __init__(self, name: str) -> None:
+        super().__init__(name)
+        self.values = bytearray()
+
+    def append(self, value: Any) -> None:
+        self.values.append(1 if value else 0)
+
+    def appendMissing(self) -> None:
+        self.values.append(2)
+
+    def get(self, index: int) -> Any:
+        value = self.values[index]
+        return None if value == 2 else value == 1
+
+    def toNumpy(self, np: Any) -> Any:
+        values = np.frombuffer(self.values, np.uint8)
+        if self.values.count(2) == 0:
+            return values == 1
+        return np.ma.masked_array(values == 1, mask=values == 2)
+
+    def nbytes(self) -> int:
+        return len(self.values)
+
+
+class gStringColumn(gColumn):
+    def __init__(self, name: str, table: gStringTable) -> None:
+        super().__init__(name)
+        self.codes = array("q")
+        self._table = table
+
+    def append(self, value: Any) -> None:
+        self.codes.append(self._table.encode(value))
+
+    def appendMissing(self) -> None:
+        self.codes.append(-1)
+
+    def get(self, index: int) -> Any:
+        code = self.codes[index]
+        return None if code < 0 else self._table.strings[code]
+
+    def toNumpy(self, np: Any) -> Any:
+        return np.array(self.codes)
+
+    def nbytes(self) -> int:
+        return self.codes.itemsize * len(self.codes)
+
+
+class gStringListColumn(gColumn):
+    def __init__(self, name: str, table: gStringTable) -> None:
+        super().__init__(name)
+        self.offsets = array("q", [0])
+        self.codes = array("q")
+        self.present = bytearray()
+        self._table = table
+
+    def append(self, value: Any) -> None:
+        encode = self._table.encode
+        self.codes.extend([encode(v) for v in value])
+        self.offsets.append(len(self.codes))
+        self.present.append(1)
+
+    def appendMissing(self) -> None:
+        self.offsets.append(len(self.codes))
+        self.present.append(0)
+
+    def get(self, index: int) -> Any:
+        if not self.present[index]:
+            return None
+        strings = self._table.strings
+        return [
+            strings[code]
+            for code in self.codes[self.offsets[index] : self.offsets[index + 1]]
+        ]
+
+    def toNumpy(self, np: Any) -> Any:
+        return np.array(self.offsets), np.array(self.codes)
+
+    def nbytes(self) -> int:
+        return (
+            self.offsets.itemsize * len(self.offsets)
+            + self.codes.itemsize * len(self.codes)
+            + len(self.present)
+        )
+
+
+def _flattenFieldsDict(fields: FieldDictStr, prefix: str = "") -> list[str]:
+    result: list[str] = []
+    for k, v in fields.items():
+        if v is None or len(v) == 0:
+            result.append(prefix + k)
+        else:
+            result.extend(_flattenFieldsDict(v, prefix + k + "."))  # type: ignore
+    return result
+
+
+def _fieldType(itemClass: type[gDataclass], name: str) -> Any:
+    *parents, field = name.split(".")
+    cls = itemClass
+    for parent in parents:
+        kind, fieldClass = getSchema(cls).wrapperTypes.get(parent, (None, None))
+        if kind != "object":
+            raise ValueError(
+                f'Field "{parent}" of class "{cls.__name__}" is not an object'
+            )
+        cls = fieldClass
+    types = getSchema(cls).types
+    if field not in types:
+        raise ValueError(f'Invalid field name "{field}" for class "{cls.__name__}"')
+    return types[field]
+
+
+class gColumnsRow(Generic[T]):
+    __slots__ = ("_columns", "_index")
+
+    def __init__(self, columns: "gColumns[T]", index: int) -> None:
+        self._columns = columns
+        self._index = index
+
+    def __getattr__(self, name: str) -> Any:
+        column = self._columns._columns.get(name)
+        if column is None:
+            raise AttributeError(name)
+        return column.get(self._index)
+
+    def __getitem__(self, name: str) -> Any:
+        return self._columns._columns[name].get(self._index)
+
+    def __repr__(self) -> str:
+        return (
+            self._columns._itemClass.__qualname__
+            + "("
+            + ", ".join([k + "=" + repr(v) for k, v in self.asDict().items()])
+            + ")"
+        )
+
+    def asDict(self) -> dict[str, Any]:
+        return {
+            name: column.get(self._index)
+            for name, column in self._columns._columns.items()
+        }
+
+
+class gColumns(Generic[T]):
+    def __init__(
+        self,
+        itemClass: type[T],
+        fields: Sequence[Any] = (),
+        integers: Iterable[str] = (),
+    ) -> None:
+        self._itemClass = itemClass
+        self._length = 0
+        self.strings = gStringTable()
+        self._columns: dict[str, gColumn] = {}
+        integers = set(integers)
+        if len(fields) > 0:
+            paths = [f for f in fields if type(f) is str and "." in f]
+            fields = [f for f in fields if f not in paths]
+            names = (
+                _flattenFieldsDict(dataclassToFieldsDict(itemClass(*fields)))
+                if len(fields) > 0
+                else []
+            )
+            names.extend(paths)
+        else:
+            names = [
+                k
+                for k, v in getSchema(itemClass).types.items()
+                if self._isSupported(v)
+            ]
+        for name in names:
+            self._columns[name] = self._createColumn(
+                name, _fieldType(itemClass, name), name in integers
+            )
+
+    @staticmethod
+    def _isSupported(fieldType: Any) -> bool:
+        if fieldType in (str, int, float, bool):
+            return True
+        return get_origin(fieldType) is list and get_args(fieldType) == (str,)
+
+    def _createColumn(self, name: str, fieldType: Any, integer: bool) -> gColumn:
+        if not self._isSupported(fieldType):
+            typeName = getattr(fieldType, "__name__", fieldType)
+            raise TypeError(
+                f'Unable to store field "{name}" of type "{typeName}" in a column'
+            )
+        if fieldType is int or (fieldType is str and integer):
+            return gNumberColumn(name, "q", int)
+        if fieldType is float:
+            return gNumberColumn(name, "d", float)
+        if fieldType is bool:
+            return gBoolColumn(name)
+        if fieldType is str:
+            return gStringColumn(name, self.strings)
+        return gStringListColumn(name, self.strings)
+
+    def getFieldsDict(self) -> FieldsDict:
+        result: FieldDictStr = {}
+        for column in self._columns.values():
+            fields = result
+            for name in column.path[:-1]:
+                fields = fields.setdefault(name, {})  # type: ignore
+            fields[column.path[-1]] = None
+        return result
+
+    @staticmethod
+    def _getData(item: Any, path: tuple[str, ...]) -> Any:
+        for name in path:
+            if type(item) is dict:
+                item = item.get(name, _missing)
+            elif item._hasAttribute(name):
+                item = item._getAttributeUnchecked(name)
+            else:
+                return _missing
+            if item is _missing:
+                return _missing
+        return item
+
+    def _append(self, item: Any) -> None:
+        if isinstance(item, gBaseObjectData) and item._payload is not None:
+            item = item._payload
+        for column in self._columns.values():
+            value = self._getData(item, column.path)
+            if value is _missing or isinstance(value, gBaseData):
+                column.appendMissing()
+            else:
+                column.append(value)
+        self._length += 1
+
+    def extend(self, items: "gListData[T] | Iterable[Any]") -> None:
+        if isinstance(items, gListData):
+            if items._payload is not None:
+                items = items._payload
+            else:
+                items = [items._getItem(i) for i in range(len(items))]
+        for item in items:
+            self._append(item)
+
+    def __len__(self) -> int:
+        return self._length
+
+    def __getitem__(self, index: int) -> gColumnsRow[T]:
+        if index < 0:
+            index += self._length
+        if not 0 <= index < self._length:
+            raise IndexError()
+        return gColumnsRow(self, index)
+
+    def __iter__(self) -> Iterator[gColumnsRow[T]]:
+        return (gColumnsRow(self, i) for i in range(self._length))
+
+    def names(self) -> list[str]:
+        return list(self._columns.keys())
+
+    def column(self, name: str) -> list[Any]:
+        column = self._columns[name]
+        return [column.get(i) for i in range(self._length)]
+
+    def codes(self, name: str) -> "array[int]":
+        column = self._columns[name]
+        if not isinstance(column, (gStringColumn, gStringListColumn)):
+            raise TypeError(f'Column "{name}" does not store strings')
+        return column.codes
+
+    def offsets(self, name: str) -> "array[int]":
+        column = self._columns[name]
+        if not isinstance(column, gStringListColumn):
+            raise TypeError(f'Column "{name}" does not store string lists')
+        return column.offsets
+
+    def nbytes(self) -> int:
+        return sum(column.nbytes() for column in self._columns.values())
+
+    def toNumpy(self, *names: str) -> dict[str, Any]:
+        import numpy
+
+        return {
+            name: self._columns[name].toNumpy(numpy)
+            for name in (names if len(names) > 0 else self._columns.keys())
+        }
+
+    def stringsToNumpy(self) -> Any:
+        import numpy
+
+        return numpy.array(self.strings.strings, dtype=object)
@@ -1,14 +1,13 @@
 from __future__ import annotations
 import os
 import json
-from typing import Any, Callable, cast, Literal, Sequence, Optional
+from typing import TYPE_CHECKING, Any, Callable, cast, Literal, Sequence, Optional
 
-import google.auth
-from google.auth.credentials import Credentials
-from google.auth.transport.requests import Request
-from google.oauth2.service_account import Credentials as ServiceAccountCredentials
-from google.oauth2.credentials import Credentials as OAuth2Credentials
-from google_auth_oauthlib.flow import Flow, InstalledAppFlow
+if TYPE_CHECKING:
+    from google.auth.credentials import Credentials
+    from google.oauth2.credentials import Credentials as OAuth2Credentials
+
+    _RefreshCredentials = OAuth2Credentials
 
 
 class gCredentials:
@@ -30,6 +29,8 @@ class gCredentials:
         return self._scopes
 
     def default(self) -> tuple[gCredentials, Optional[str]]:
+        import google.auth
+
         credentials, project_id = google.auth.default(scopes=self._scopes)
         return _gCredentialsCredentials(self, cast(Any, credentials)), cast(Any, project_id)
 
@@ -44,6 +45,8 @@ class gCredentials:
         credentials_path: str = "credentials.json",
         token_path: str = "token.json",
     ) -> gCredentials:
+        from google.oauth2.credentials import Credentials as OAuth2Credentials
+
         return _gCredentialsRefresh(
             self,
             OAuth2Credentials.from_authorized_user_info,
@@ -57,6 +60,8 @@ class gCredentials:
         credentials_path: str = "credentials.json",
         token_path: str = "token.json",
     ) -> gCredentials:
+        from google.oauth2.credentials import Credentials as OAuth2Credentials
+
         return _gCredentialsRefreshUrl(
             self,
             OAuth2Credentials.from_authorized_user_info,
@@ -69,6 +74,10 @@ class gCredentials:
         self,
         credentials_path: str = "credentials.json",
     ) -> gCredentials:
+        from google.oauth2.service_account import (
+            Credentials as ServiceAccountCredentials,
+        )
+
         return _gCredentialsFile(
             self,
             lambda data, scopes: ServiceAccountCredentials.from_service_account_info(
@@ -127,9 +136,6 @@ class _gCredentialsFile(_gCredentials):
         return self._credentials
 
 
-_RefreshCredentials = OAuth2Credentials
-
-
 class _gCredentialsRefresh(_gCredentials):
     _credentials_path: str
     _token_path: str
@@ -169,6 +175,8 @@ class _gCredentialsRefresh(_gCredentials):
         if credentials.valid:
             return True
         if credentials.expired:
+            from google.auth.transport.requests import Request
+
             credentials.refresh(Request())
         return credentials.valid
 
@@ -189,6 +197,8 @@ class _gCredentialsRefresh(_gCredentials):
         return None
 
     def _fetch_credentials(self):
+        from google_auth_oauthlib.flow import InstalledAppFlow
+
         with self._open_file("credentials", "r") as file:
             flow = InstalledAppFlow.from_client_config(json.load(file), self._scopes)
             credentials = flow.run_local_server()
@@ -218,6 +228,8 @@ class _gCredentialsRefreshUrl(_gCredentialsRefresh):
         self._url_callback = url_callback
 
     def _fetch_credentials(self):
+        from google_auth_oauthlib.flow import Flow
+
         with self._open_file("credentials", "r") as file:
             flow = Flow.from_client_config(
                 json.load(file),
@@ -1,12 +1,23 @@
 from .gResource import gResource
+import atexit
+import json
+import os
+import threading
+from contextvars import ContextVar
+from copy import deepcopy
+from functools import partial
 from itertools import chain, count
 from abc import abstractmethod
 from .utils import mergeDicts, swapDict, isSubclassOrigin
+from types import MappingProxyType
 from typing import (
+    TYPE_CHECKING,
     Any,
+    Callable,
     cast,
     Generic,
     Iterable,
+    Literal,
     Self,
     Tuple,
     TypeVar,
@@ -16,20 +27,85 @@ from typing import (
     get_args,
 )
 
+if TYPE_CHECKING:
+    from .gColumns import gColumns
+
+
+class gSchema:
+    __slots__ = (
+        "name",
+        "fields",
+        "types",
+        "typeToName",
+        "acceptedTypes",
+        "defaults",
+        "dataclasses",
+        "wrappers",
+        "wrapperTypes",
+    )
+
+    def __init__(self, cls: type) -> None:
+        annotations: dict[str, Any] = dict(cls.__dict__.get("__annotations__", {}))
+        self.name: str = cls.__name__
+        self.fields = tuple(annotations.keys())
+        self.types: MappingProxyType[str, Any] = MappingProxyType(annotations)
+        self.typeToName: MappingProxyType[Any, str] = MappingProxyType(
+            swapDict(annotations)
+        )
+        self.acceptedTypes: MappingProxyType[str, tuple[Any, ...]] = MappingProxyType(
+            {k: (v, get_origin(v)) for k, v in annotations.items()}
+        )
+        self.defaults: MappingProxyType[str, Callable[[], Any]] = MappingProxyType(
+            {k: v for k, v in annotations.items() if callable(v)}
+        )
+        self.dataclasses: MappingProxyType[str, Any] = MappingProxyType(
+            {
+                k: v
+                for k, v in annotations.items()
+                if isinstance(get_origin(v) or v, type)
+                and isSubclassOrigin(v, gDataclass)
+            }
+        )
+        wrappers: list[tuple[str, Literal["object", "list", "dict"], Any]] = []
+        for k, v in annotations.items():
+            origin = get_origin(v)
+            if origin is gList:
+                itemType = get_args(v)[0]
+                if isinstance(itemType, type) and issubclass(itemType, gDataclass):
+                    wrappers.append((k, "list", itemType))
+            elif origin is gDict:
+                valueType = get_args(v)[1]
+                if isinstance(valueType, type) and issubclass(valueType, gDataclass):
+                    wrappers.append((k, "dict", valueType))
+            elif k in self.dataclasses:
+                wrappers.append((k, "object", v))
+        self.wrappers = tuple(wrappers)
+        self.wrapperTypes: MappingProxyType[
+            str, tuple[Literal["object", "list", "dict"], Any]
+        ] = MappingProxyType({k: (kind, t) for k, kind, t in wrappers})
+
 
 class gDataclassMetaclass(type):
     def __getattr__(self, name: str) -> str:
         return name
 
+    def getSchema(cls) -> gSchema:
+        schema = cls.__dict__.get("__gSchema__")
+        if schema is None:
+            schema = gSchema(cls)
+            type.__setattr__(cls, "__gSchema__", schema)
+        return schema
+
 
 class gDataclass(metaclass=gDataclassMetaclass):
     @classmethod
     def allFields(cls, depth: int = 0) -> Self:
+        schema = getSchema(cls)
         if depth == 0:
-            return cls(*cls.__annotations__.keys())
+            return cls(*schema.fields)
         result = {}
-        for k, v in cls.__annotations__.items():
-            if isSubclassOrigin(v, gDataclass):
+        for k, v in schema.types.items():
+            if k in schema.dataclasses:
                 result[k] = cast(gDataclass, v).allFields(depth - 1)
             else:
                 result[k] = v()
@@ -40,22 +116,22 @@ class gDataclass(metaclass=gDataclassMetaclass):
 
     def __init__(self, *args: Tuple[Any, Any] | Any, **kwargs: Any) -> None:
         super().__init__()
+        schema = getSchema(type(self))
         if len(args) > 0:
             result: list[tuple[Any, Any]] = []
-            swapped_annotations = swapDict(self.__annotations__)
             for arg in args:
                 if isinstance(arg, gDataclass):
                     argType = type(arg)
-                    if argType not in swapped_annotations:
+                    if argType not in schema.typeToName:
                         raise ValueError(
                             f'Unable to find field with type "{argType.__name__}"'
                         )
-                    name = swapped_annotations[argType]
+                    name = schema.typeToName[argType]
                     result.append((name, arg))
                 elif type(arg) is str:
-                    if arg not in self.__annotations__:
+                    if arg not in schema.types:
                         raise ValueError(f'Unable to find field with name "{arg}"')
-                    default_value = self.__annotations__[arg]()
+                    default_value = schema.defaults[arg]()
                     result.append((arg, default_value))
                 elif type(arg) is tuple:
                     result.append(cast(tuple[Any, Any], arg))
@@ -63,17 +139,19 @@ class gDataclass(metaclass=gDataclassMetaclass):
                     raise TypeError(f"Invalid argument type: {type(arg).__name__}")
             args = tuple(result)
         for k, v in chain(args, kwargs.items()):
-            if k not in self.__annotations__:
+            if k not in schema.types:
                 raise ValueError(f"Invalid variable name: {k}")
-            if type(v) is not self.__annotations__[k] and type(v) is not get_origin(
-                self.__annotations__[k]
-            ):
+            if type(v) not in schema.acceptedTypes[k]:
                 raise TypeError(
-                    f"Invalid type: {type(v).__name__}, of variable '{k}', required type: {self.__annotations__[k].__name__}"
+                    f"Invalid type: {type(v).__name__}, of variable '{k}', required type: {schema.types[k].__name__}"
                 )
             setattr(self, k, v)
 
 
+def getSchema(cls: type[gDataclass]) -> gSchema:
+    return type(cls).getSchema(cls)
+
+
 T = TypeVar("T", bound=gDataclass)
 K = TypeVar("K", str, int)
 V = TypeVar("V", bound=gDataclass)
@@ -122,6 +200,18 @@ FieldDictNone = dict[None, "FieldsDict"]
 FieldsDict = FieldDictStr | FieldDictInt | FieldDictNone
 
 
+def mergePayload(a: Any, b: Any) -> Any:
+    if type(a) is dict and type(b) is dict:
+        for k, v in cast(dict[Any, Any], b).items():
+            a[k] = mergePayload(a[k], v) if k in a else v
+        return a
+    if type(a) is list and type(b) is list and len(a) == len(b):
+        for i, v in enumerate(cast(list[Any], b)):
+            a[i] = mergePayload(a[i], v)
+        return a
+    return b
+
+
 class gBaseData(Generic[T]):
     @abstractmethod
     def setData(self, data: Any) -> None: ...
@@ -133,12 +223,20 @@ class gBaseData(Generic[T]):
         super().__init__()
         self._variableName = variableName
         self._variableClass = variableClass
+        self._schema = getSchema(variableClass)
+        self._payload: Any = None
+
+    def _isView(self) -> bool:
+        return cast(gBaseData[Any], getattr(self, "_previous"))._isView()
+
+    def _bindPayload(self, data: Any) -> None:
+        self._payload = data
 
-    def _getVariableItemTypes(self) -> dict[str, Any]:
-        return self._variableClass.__annotations__
+    def _getVariableItemTypes(self) -> MappingProxyType[str, Any]:
+        return self._schema.types
 
     def _hasVariableAttribute(self, name: str) -> bool:
-        return name in self._variableClass.__annotations__
+        return name in self._schema.types
 
     def _hasAttribute(self, name: str) -> bool:
         return name in self.__dict__
@@ -183,7 +281,19 @@ class gBaseData(Generic[T]):
 class gBaseObjectData(Generic[T], gBaseData[T], gDataclass):
     def __init__(self, variableName: str, variableClass: type[T]) -> None:
         super().__init__(variableName, variableClass)
-        self._setupVariables()
+
+    def _hasAttribute(self, name: str) -> bool:
+        return name in self.__dict__ or (
+            self._payload is not None and name in self._payload
+        )
+
+    def _getAttributeUnchecked(self, name: str) -> Any:
+        try:
+            return self.__dict__[name]
+        except KeyError:
+            if name in self._schema.wrapperTypes:
+                return self._createWrapper(name)
+            return self._payload[name]
 
     def __repr__(self) -> str:
         return (
@@ -202,41 +312,45 @@ class gBaseObjectData(Generic[T], gBaseData[T], gDataclass):
     def __getattr__(self, name: str) -> Any:
         if not self._hasVariableAttribute(name):
             raise AttributeError()
+        if name in self._schema.wrapperTypes:
+            return self._createWrapper(name)
+        if self._payload is not None and name in self._payload:
+            return self._payload[name]
+        scope = _deferredScope.get()
+        if scope is not None:
+            self.getFieldsDict({name: None})
+            return gDeferred(scope, self, name)
         self.getFieldsDict({name: None})
         if not self._hasAttribute(name):
             raise RuntimeError(f"Unable to fetch requested resource: {name}")
         return self._getAttributeUnchecked(name)
 
-    def _setupVariables(self) -> None:
-        for k, v in self._getVariableItemTypes().items():
-            origin = get_origin(v)
-            if origin is not None:
-                if origin is gList:
-                    itemType = get_args(v)[0]
-                    if not issubclass(itemType, gDataclass):
-                        continue
-                    data = gListData(k, itemType, self)
-                    setattr(self, k, data)
-                elif origin is gDict:
-                    valueType = get_args(v)[1]
-                    if not issubclass(valueType, gDataclass):
-                        continue
-                    data = cast(
-                        gDictData[Any, gDataclass], gDictData(k, valueType, self)
-                    )
-                    setattr(self, k, data)
-                elif issubclass(origin, gDataclass):
-                    objdata = gObjectData(k, v, self)
-                    setattr(self, k, objdata)
-            elif issubclass(v, gDataclass):
-                objdata = gObjectData(k, v, self)
-                setattr(self, k, objdata)
+    def _createWrapper(self, name: str) -> gBaseData[Any]:
+        kind, itemType = self._schema.wrapperTypes[name]
+        if kind == "list":
+            wrapper: gBaseData[Any] = gListData(name, itemType, self)
+        elif kind == "dict":
+            wrapper = cast(gDictData[Any, gDataclass], gDictData(name, itemType, self))
+        else:
+            wrapper = gObjectData(name, itemType, self)
+        setattr(self, name, wrapper)
+        if self._payload is not None and name in self._payload:
+            wrapper._bindPayload(self._payload[name])
+        return wrapper
+
+    def _getAttributeWrapperSafe(self, name: str) -> Union["gBaseData[T]", None]:
+        if name in self._schema.wrapperTypes and not self._hasAttribute(name):
+            return self._createWrapper(name)
+        return super()._getAttributeWrapperSafe(name)
 
     def setData(self, data: Any) -> None:
         if type(data) is not dict:
             raise RuntimeError(
                 f"Received invalid data type {type(data).__name__} for object class: {self._variableClass.__name__}"
             )
+        if self._payload is not None or self._isView():
+            self._setPayload(cast(dict[Any, Any], data))
+            return
         for k, v in cast(dict[Any, Any], data).items():
             variable = self._getAttributeWrapperSafe(k)
             if variable is not None:
@@ -244,6 +358,26 @@ class gBaseObjectData(Generic[T], gBaseData[T], gDataclass):
                 continue
             setattr(self, k, v)
 
+    def _setPayload(self, data: dict[Any, Any]) -> None:
+        payload = self._payload
+        if payload is None:
+            self._payload = data
+            for k, v in list(self.__dict__.items()):
+                if k in data and isinstance(v, gBaseData):
+                    cast(gBaseData[Any], v).setData(data[k])
+            return
+        if payload is data:
+            return
+        for k, v in data.items():
+            wrapper = self.__dict__.get(k)
+            if k not in payload:
+                payload[k] = v
+            elif not isinstance(wrapper, gBaseData):
+                payload[k] = mergePayload(payload[k], v)
+                continue
+            if isinstance(wrapper, gBaseData):
+                cast(gBaseData[Any], wrapper).setData(v)
+
     def getFields(self, *fields: Any) -> Self:
         missingFields = self.getMissingFields(self._createDataclassFromFields(fields))
         if len(missingFields) > 0:
@@ -284,6 +418,12 @@ class gBaseDictData(Generic[K, V], gBaseData[V]):
     @abstractmethod
     def _setData(self, data: Any) -> None: ...
 
+    @abstractmethod
+    def _hasPayloadKey(self, key: K) -> bool: ...
+
+    @abstractmethod
+    def _payloadKeys(self) -> Iterable[K]: ...
+
     def __init__(
         self, valueName: str, valueClass: Type[V], previous: gBaseData[Any]
     ) -> None:
@@ -297,25 +437,47 @@ class gBaseDictData(Generic[K, V], gBaseData[V]):
 
     def __len__(self) -> int:
         if not self._hasData:
-            self.getFieldsDict(None)
+            self._fetchAll()
+        if self._payload is not None:
+            return len(self._payload)
         return len(self._items)
 
     def __getitem__(self, key: K) -> gDictItemData[K, V]:
-        if self._hasData and key not in self._items:
+        if self._hasData and not self._hasKey(key):
             raise IndexError()
         return self._getItem(key)
 
+    def _hasKey(self, key: K) -> bool:
+        if self._payload is not None:
+            return self._hasPayloadKey(key)
+        return key in self._items
+
     def _getItem(self, key: K) -> gDictItemData[K, V]:
         if key not in self._items:
-            self._items[key] = gDictItemData(
-                self._variableName, self._variableClass, self, key
-            )
+            item = gDictItemData(self._variableName, self._variableClass, self, key)
+            self._items[key] = item
+            if self._payload is not None and self._hasPayloadKey(key):
+                item._bindPayload(self._payload[key])
         return self._items[key]
 
+    def _materialize(self) -> dict[K, gDictItemData[K, V]]:
+        if self._payload is not None:
+            for key in self._payloadKeys():
+                self._getItem(key)
+        return self._items
+
+    def _fetchAll(self) -> None:
+        self.getFieldsDict(None)
+        resolveDeferredFields()
+
     def setData(self, data: Any) -> None:
         self._hasData = True
         self._setData(data)
 
+    def _bindPayload(self, data: Any) -> None:
+        self._hasData = True
+        self._setData(data)
+
     def getFieldsDict(self, fields: FieldsDict | None) -> None:
         self._previous.getFieldsDict({self._variableName: fields})
 
@@ -329,20 +491,61 @@ class gListData(Generic[T], gBaseDictData[int, T]):
         return (
             self._variableClass.__qualname__
             + "["
-            + ", ".join([repr(v) for v in self._items.values()])
+            + ", ".join([repr(v) for v in self._materialize().values()])
             + "]"
         )
 
     def __contains__(self, obj: T) -> bool:
         if not self._hasData:
-            self.getFieldsDict(None)
-        return obj in self._items.values()
+            self._fetchAll()
+        return obj in self._materialize().values()
+
+    def _hasPayloadKey(self, key: int) -> bool:
+        return type(key) is int and 0 <= key < len(self._payload)
+
+    def _payloadKeys(self) -> Iterable[int]:
+        return range(len(self._payload))
+
+    def _setPayload(self, data: list[Any]) -> None:
+        payload = self._payload
+        if payload is None:
+            self._payload = data
+            for i, item in self._items.items():
+                if i < len(data):
+                    item.setData(data[i])
+            return
+        if payload is data:
+            return
+        for i, v in enumerate(data):
+            if i >= len(payload):
+                payload.append(v)
+                if i in self._items:
+                    self._items[i].setData(v)
+            elif i in self._items:
+                self._items[i].setData(v)
+            else:
+                payload[i] = mergePayload(payload[i], v)
+
+    def asColumns(
+        self, *fields: Any, integers: Iterable[str] = ()
+    ) -> "gColumns[T]":
+        from .gColumns import gColumns
+
+        columns = gColumns(self._variableClass, fields, integers)
+        if not self._hasData:
+            self.getFieldsDict({None: columns.getFieldsDict()})
+            resolveDeferredFields()
+        columns.extend(self)
+        return columns
 
     def _setData(self, data: Any) -> None:
         if type(data) is not list:
             raise RuntimeError(
                 f"Received invalid data type {type(data).__name__} for list class: {self._variableClass.__name__}"
             )
+        if self._payload is not None or self._isView():
+            self._setPayload(cast(list[Any], data))
+            return
         for i, v in zip(count(), cast(list[Any], data)):
             self._getItem(i).setData(v)
 
@@ -352,32 +555,54 @@ class gDictData(Generic[K, V], gBaseDictData[K, V]):
         return (
             self._variableClass.__qualname__
             + "{"
-            + ", ".join([repr(k) + ": " + repr(v) for k, v in self._items.items()])
+            + ", ".join(
+                [repr(k) + ": " + repr(v) for k, v in self._materialize().items()]
+            )
             + "}"
         )
 
     def __contains__(self, obj: K) -> bool:
         if not self._hasData:
-            self.getFieldsDict(None)
-        return obj in self._items
+            self._fetchAll()
+        return self._hasKey(obj)
+
+    def _hasPayloadKey(self, key: K) -> bool:
+        return key in self._payload
+
+    def _payloadKeys(self) -> Iterable[K]:
+        return self._payload.keys()
 
     def _setData(self, data: Any) -> None:
         if type(data) is not dict:
             raise RuntimeError(
                 f"Received invalid data type {type(data).__name__} for dict class: {self._variableClass.__name__}"
             )
-        for k, v in cast(dict[Any, Any], data):
+        if self._payload is not None or self._isView():
+            if self._payload is None:
+                self._payload = data
+                for k, item in self._items.items():
+                    if k in data:
+                        item.setData(data[k])
+            elif self._payload is not data:
+                for k, v in cast(dict[Any, Any], data).items():
+                    if k in self._items:
+                        self._payload.setdefault(k, v)
+                        self._items[k].setData(v)
+                    else:
+                        self._payload[k] = mergePayload(self._payload.get(k), v)
+            return
+        for k, v in cast(dict[Any, Any], data).items():
             self._getItem(k).setData(v)
 
     def keys(self) -> list[K]:
         if not self._hasData:
-            self.getFieldsDict(None)
-        return list(self._items.keys())
+            self._fetchAll()
+        return list(self._materialize().keys())
 
     def values(self) -> list[gDictItemData[K, V]]:
         if not self._hasData:
-            self.getFieldsDict(None)
-        return list(self._items.values())
+            self._fetchAll()
+        return list(self._materialize().values())
 
     def items(self) -> list[tuple[K, gDictItemData[K, V]]]:
         return list(zip(self.keys(), self.values()))
@@ -390,12 +615,14 @@ class gData(Generic[T], gBaseObjectData[T]):
         resource: gResource,
         kwargs: dict[str, Any] = {},
         executeOnlyOnce: bool = False,
+        view: bool | None = None,
     ) -> None:
         super().__init__(variableClass.__name__, variableClass)
         self._resource = resource
         self._kwargs = kwargs
         self._executeOnlyOnce = executeOnlyOnce
         self._executed = False
+        self._view = _viewMode if view is None else view
 
     @staticmethod
     def _convertFieldsToGoogleFormat(fields: FieldsDict) -> Any:
@@ -414,26 +641,438 @@ class gData(Generic[T], gBaseObjectData[T]):
                     fieldsFormat.append(f"{k}({value})")
         return ",".join(fieldsFormat)
 
-    def _execute(self, fields: str) -> None:
+    @staticmethod
+    def _convertGoogleFormatToFields(fields: str) -> FieldsDict:
+        result: FieldDictStr = {}
+        stack: list[FieldDictStr] = [result]
+        name = ""
+        for c in fields + ",":
+            if c == "(":
+                child: FieldDictStr = {}
+                stack[-1][name.strip()] = child
+                stack.append(child)
+                name = ""
+            elif c == ")" or c == ",":
+                if len(name.strip()) > 0:
+                    stack[-1][name.strip()] = None
+                if c == ")":
+                    stack.pop()
+                name = ""
+            else:
+                name += c
+        return result
+
+    def _createRequest(self, fields: str) -> Any:
         if self._executeOnlyOnce and self._executed:
             raise RuntimeError("This resource cannot be called twice")
         self._executed = True
-        data = self._resource(**self._kwargs, fields=fields).execute()
-        self.setData(data)
+        return self._resource(**self._kwargs, fields=fields)
 
-    def getFieldsDict(self, fields: FieldsDict | None) -> None:
+    def _setCachedData(
+        self, cache: "gResponseCacheBase", key: Any, fields: str, data: Any
+    ) -> None:
+        cache.put(key, fields, data)
+        self.setData(deepcopy(data))
+
+    def _isView(self) -> bool:
+        return self._view
+
+    def _execute(self, fields: str) -> None:
+        request = self._createRequest(fields)
+        callback = self.setData
+        cache = _responseCache
+        if cache is not None:
+            if self._executeOnlyOnce:
+                cache.invalidate(request)
+            else:
+                key = cache.getKey(request, self._kwargs)
+                if key is not None:
+                    data = cache.get(key, fields)
+                    if data is not None:
+                        self.setData(deepcopy(data))
+                        return
+                    callback = partial(self._setCachedData, cache, key, fields)
+        queue = _requestQueue.get()
+        if queue is not None:
+            queue.addRequest(request, callback, self)
+        else:
+            callback(request.execute())
+
+    def _fetchFieldsDict(self, fields: FieldsDict | None) -> None:
         if fields is not None:
             googleFields = self._convertFieldsToGoogleFormat(fields)
         else:
             googleFields = ""
         self._execute(googleFields)
 
+    def getFieldsDict(self, fields: FieldsDict | None) -> None:
+        scope = _deferredScope.get()
+        if scope is not None and fields is not None:
+            scope.add(self, fields)
+        else:
+            self._fetchFieldsDict(fields)
+
     def execute(self) -> None:
         self._execute("")
 
 
+def mergeFieldsDicts(a: FieldsDict, b: FieldsDict) -> FieldsDict:
+    result = cast(dict[Any, Any], a)
+    for k, v in cast(dict[Any, Any], b).items():
+        if type(k) is int:
+            k = None
+        if k not in result:
+            result[k] = None if v is None else mergeFieldsDicts({}, v)
+        elif result[k] is None or v is None:
+            result[k] = None
+        else:
+            result[k] = mergeFieldsDicts(result[k], v)
+    for k in [k for k in result if type(k) is int]:
+        v = result.pop(k)
+        if None not in result:
+            result[None] = v
+        elif result[None] is not None:
+            result[None] = None if v is None else mergeFieldsDicts(result[None], v)
+    return cast(FieldsDict, result)
+
+
+class gResponseCacheBase:
+    @abstractmethod
+    def getKey(self, request: Any, kwargs: dict[str, Any]) -> Any | None: ...
+
+    @abstractmethod
+    def get(self, key: Any, fields: str) -> Any | None: ...
+
+    @abstractmethod
+    def put(self, key: Any, fields: str, data: Any) -> None: ...
+
+    @abstractmethod
+    def invalidate(self, request: Any) -> None: ...
+
+
+_responseCache: gResponseCacheBase | None = None
+
+
+def setResponseCache(cache: gResponseCacheBase | None) -> None:
+    global _responseCache
+    _responseCache = cache
+
+
+def getResponseCache() -> gResponseCacheBase | None:
+    return _responseCache
+
+
+_viewMode = False
+
+
+def setViewMode(view: bool) -> None:
+    global _viewMode
+    _viewMode = view
+
+
+def getViewMode() -> bool:
+    return _viewMode
+
+
+class gRequestQueue:
+    @abstractmethod
+    def addRequest(
+        self, request: Any, callback: Callable[[Any], None], source: Any
+    ) -> None: ...
+
+
+_requestQueue: ContextVar[gRequestQueue | None] = ContextVar(
+    "_requestQueue", default=None
+)
+
+
+def getRequestQueue() -> gRequestQueue | None:
+    return _requestQueue.get()
+
+
+class gDeferredScope:
+    def __init__(self) -> None:
+        self._pending: dict[int, tuple[gData[Any], FieldsDict]] = {}
+        self._token: Any = None
+
+    def add(self, data: "gData[Any]", fields: FieldsDict) -> None:
+        key = id(data)
+        if key in self._pending:
+            mergeFieldsDicts(self._pending[key][1], fields)
+        else:
+            self._pending[key] = (data, mergeFieldsDicts({}, fields))
+
+    def resolve(self) -> None:
+        pending = self._pending
+        self._pending = {}
+        for data, fields in pending.values():
+            data._fetchFieldsDict(fields)
+
+    def __enter__(self) -> Self:
+        self._token = _deferredScope.set(self)
+        return self
+
+    def __exit__(self, exc_type: Any, exc_val: Any, exc_tb: Any) -> None:
+        _deferredScope.reset(self._token)
+        if exc_type is None:
+            self.resolve()
+        else:
+            self._pending.clear()
+
+
+_deferredScope: ContextVar[gDeferredScope | None] = ContextVar(
+    "_deferredScope", default=None
+)
+
+
+def resolveDeferredFields() -> None:
+    scope = _deferredScope.get()
+    if scope is not None:
+        scope.resolve()
+
+
+class gDeferred:
+    __slots__ = ("_scope", "_owner", "_name")
+
+    def __init__(
+        self, scope: gDeferredScope, owner: gBaseData[Any], name: str
+    ) -> None:
+        self._scope = scope
+        self._owner = owner
+        self._name = name
+
+    def get(self) -> Any:
+        owner = self._owner
+        if not owner._hasAttribute(self._name):
+            self._scope.resolve()
+            if not owner._hasAttribute(self._name):
+                raise RuntimeError(f"Unable to fetch requested resource: {self._name}")
+        return owner._getAttributeUnchecked(self._name)
+
+    @property
+    def value(self) -> Any:
+        return self.get()
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self.get(), name)
+
+    def __str__(self) -> str:
+        return str(self.get())
+
+    def __repr__(self) -> str:
+        return repr(self.get())
+
+    def __format__(self, format_spec: str) -> str:
+        return format(self.get(), format_spec)
+
+    def __bool__(self) -> bool:
+        return bool(self.get())
+
+    def __eq__(self, other: Any) -> bool:
+        return self.get() == other
+
+    def __ne__(self, other: Any) -> bool:
+        return self.get() != other
+
+    def __lt__(self, other: Any) -> bool:
+        return self.get() < other
+
+    def __le__(self, other: Any) -> bool:
+        return self.get() <= other
+
+    def __gt__(self, other: Any) -> bool:
+        return self.get() > other
+
+    def __ge__(self, other: Any) -> bool:
+        return self.get() >= other
+
+    def __hash__(self) -> int:
+        return hash(self.get())
+
+    def __int__(self) -> int:
+        return int(self.get())
+
+    def __float__(self) -> float:
+        return float(self.get())
+
+    def __len__(self) -> int:
+        return len(self.get())
+
+    def __iter__(self) -> Any:
+        return iter(self.get())
+
+    def __getitem__(self, key: Any) -> Any:
+        return self.get()[key]
+
+    def __contains__(self, item: Any) -> bool:
+        return item in self.get()
+
+
+def dataclassToFieldsDict(dataclass: gDataclass) -> FieldDictStr:
+    result: FieldDictStr = {}
+    for field, value in dataclass.__dict__.items():
+        if isinstance(value, gDataclass):
+            result[field] = dataclassToFieldsDict(value)
+        else:
+            result[field] = None
+    return result
+
+
+class gFieldLearnerStats:
+    def __init__(self) -> None:
+        self.requests = 0
+        self.prefetched = 0
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def overfetched(self) -> int:
+        return self.prefetched - self.hits
+
+    def asDict(self) -> dict[str, int]:
+        return {
+            "requests": self.requests,
+            "prefetched": self.prefetched,
+            "hits": self.hits,
+            "misses": self.misses,
+            "overfetched": self.overfetched,
+        }
+
+
+class gFieldLearner:
+    def __init__(self, path: str | None = None, autosave: bool = True) -> None:
+        self._path = path
+        self._lock = threading.Lock()
+        self._profiles: dict[str, FieldsDict] = {}
+        self._stats: dict[str, gFieldLearnerStats] = {}
+        if path is not None:
+            self.load(path)
+            if autosave:
+                atexit.register(self.save)
+
+    def load(self, path: str) -> None:
+        if not os.path.exists(path):
+            return
+        with open(path, "r") as file:
+            profiles: dict[str, str] = json.load(file)
+        with self._lock:
+            for key, fields in profiles.items():
+                self._profiles[key] = gData._convertGoogleFormatToFields(fields)
+
+    def save(self, path: str | None = None) -> None:
+        path = path if path is not None else self._path
+        if path is None:
+            raise ValueError("No path to save the field profiles to")
+        with self._lock:
+            profiles = {
+                k: gData._convertFieldsToGoogleFormat(v)
+                for k, v in self._profiles.items()
+                if len(v) > 0
+            }
+        tmpPath = f"{path}.{os.getpid()}.tmp"
+        with open(tmpPath, "w") as file:
+            json.dump(profiles, file, indent=2, sort_keys=True)
+        os.replace(tmpPath, path)
+
+    def _getStats(self, key: str) -> gFieldLearnerStats:
+        stats = self._stats.get(key)
+        if stats is None:
+            stats = gFieldLearnerStats()
+            self._stats[key] = stats
+        return stats
+
+    def prefetch(self, key: str, fields: FieldsDict) -> tuple[FieldsDict, set[Any]]:
+        with self._lock:
+            stats = self._getStats(key)
+            stats.requests += 1
+            profile = self._profiles.get(key)
+            if profile is None:
+                return fields, set()
+            prefetched = set(profile.keys()).difference(fields.keys())
+            stats.prefetched += len(prefetched)
+            return mergeFieldsDicts(mergeFieldsDicts({}, fields), profile), prefetched
+
+    def record(self, key: str, fields: FieldsDict, miss: bool) -> None:
+        with self._lock:
+            if miss:
+                self._getStats(key).misses += 1
+            profile = self._profiles.get(key)
+            if profile is None:
+                self._profiles[key] = mergeFieldsDicts({}, fields)
+            else:
+                mergeFieldsDicts(profile, fields)
+
+    def hit(self, key: str) -> None:
+        with self._lock:
+            self._getStats(key).hits += 1
+
+    def reset(self) -> None:
+        with self._lock:
+            self._profiles.clear()
+            self._stats.clear()
+
+    def stats(self) -> dict[str, dict[str, int]]:
+        with self._lock:
+            return {k: v.asDict() for k, v in self._stats.items()}
+
+    def totalStats(self) -> dict[str, int]:
+        total = gFieldLearnerStats()
+        with self._lock:
+            for stats in self._stats.values():
+                total.requests += stats.requests
+                total.prefetched += stats.prefetched
+                total.hits += stats.hits
+                total.misses += stats.misses
+        return total.asDict()
+
+
+_fieldLearner: gFieldLearner | None = None
+
+
+def setFieldLearner(learner: gFieldLearner | None) -> None:
+    global _fieldLearner
+    _fieldLearner = learner
+
+
+def getFieldLearner() -> gFieldLearner | None:
+    return _fieldLearner
+
+
+class gProfiledData(Generic[T], gData[T]):
+    def __init__(
+        self,
+        variableClass: Type[T],
+        resource: gResource,
+        kwargs: dict[str, Any],
+        executeOnlyOnce: bool,
+        learner: gFieldLearner,
+        profileKey: str,
+    ) -> None:
+        super().__init__(variableClass, resource, kwargs, executeOnlyOnce)
+        self._learner = learner
+        self._profileKey = profileKey
+        self._prefetched: set[Any] = set()
+
+    def __getattribute__(self, name: str) -> Any:
+        if name[0] != "_":
+            prefetched = object.__getattribute__(self, "_prefetched")
+            if name in prefetched:
+                prefetched.discard(name)
+                learner = object.__getattribute__(self, "_learner")
+                learner.hit(object.__getattribute__(self, "_profileKey"))
+        return super().__getattribute__(name)
+
+    def _fetchFieldsDict(self, fields: FieldsDict | None) -> None:
+        if fields is None:
+            return super()._fetchFieldsDict(fields)
+        self._learner.record(self._profileKey, fields, self._executed)
+        if not self._executed:
+            fields, self._prefetched = self._learner.prefetch(self._profileKey, fields)
+        super()._fetchFieldsDict(fields)
+
+
 def executeGDataResource(dataclass: gDataclass) -> None:
-    if type(dataclass) is not gData:
+    if not isinstance(dataclass, gData):
         raise TypeError(
             f"Invalid given type: {type(dataclass).__name__}, is it top level?"
         )
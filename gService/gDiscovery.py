@@ -0,0 +1,94 @@
+import hashlib
+import os
+import threading
+import time
+from typing import Any, Callable
+
+
+def _libraryVersion() -> str:
+    from importlib.metadata import PackageNotFoundError, version
+
+    try:
+        return version("google-api-python-client")
+    except PackageNotFoundError:
+        return "unknown"
+
+
+class gDiscoveryCache:
+    FormatVersion = 1
+
+    def __init__(self, directory: str | None = None, maxAge: float = 86400) -> None:
+        if directory is not None:
+            directory = os.path.expanduser(directory)
+        self._directory = directory
+        self._maxAge = maxAge
+        self._lock = threading.Lock()
+        self._documents: dict[str, tuple[float, str]] = {}
+        self._decoder: Callable[[str], Any] | None = None
+        self._version: str | None = None
+        if directory is not None:
+            os.makedirs(directory, exist_ok=True)
+
+    def _getPath(self, key: str) -> str | None:
+        if self._directory is None:
+            return None
+        if self._version is None:
+            self._version = f"{_libraryVersion()}.{self.FormatVersion}"
+        return os.path.join(self._directory, f"{key}.{self._version}.json")
+
+    def _read(self, key: str, maxAge: float | None) -> str | None:
+        now = time.time()
+        with self._lock:
+            entry = self._documents.get(key)
+        if entry is not None and (maxAge is None or now - entry[0] < maxAge):
+            return entry[1]
+        path = self._getPath(key)
+        if path is None:
+            return None
+        try:
+            modified = os.path.getmtime(path)
+            if maxAge is not None and now - modified >= maxAge:
+                return None
+            with open(path, "r", encoding="utf-8") as file:
+                content = file.read()
+        except OSError:
+            return None
+        with self._lock:
+            self._documents[key] = (modified, content)
+        return content
+
+    def _write(self, key: str, content: str) -> None:
+        with self._lock:
+            self._documents[key] = (time.time(), content)
+        path = self._getPath(key)
+        if path is None:
+            return
+        tmpPath = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(tmpPath, "w", encoding="utf-8") as file:
+            file.write(content)
+        os.replace(tmpPath, path)
+
+    def getDocument(self, serviceName: str, version: str) -> dict[str, Any] | None:
+        key = f"{serviceName}.{version}"
+        content = self._read(key, None)
+        if content is None:
+            from googleapiclient.discovery_cache import get_static_doc
+
+            content = get_static_doc(serviceName, version)
+            if content is None:
+                return None
+            self._write(key, content)
+        if self._decoder is None:
+            from .gModel import findDecoder
+
+            self._decoder = findDecoder()[0]
+        return self._decoder(content)
+
+    def get(self, url: str) -> str | None:
+        return self._read(hashlib.sha1(url.encode("utf-8")).hexdigest(), self._maxAge)
+
+    def set(self, url: str, content: str) -> None:
+        self._write(hashlib.sha1(url.encode("utf-8")).hexdigest(), content)
+
+
+defaultDiscoveryCache = gDiscoveryCache()
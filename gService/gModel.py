@@ -0,0 +1,46 @@
+import json
+from googleapiclient.model import JsonModel
+from typing import Any, Callable
+
+Decoder = Callable[[bytes | str], Any]
+
+
+def findDecoder() -> tuple[Decoder, tuple[type[Exception], ...]]:
+    try:
+        import orjson
+
+        return orjson.loads, (orjson.JSONDecodeError,)
+    except ImportError:
+        pass
+    try:
+        import msgspec
+
+        return msgspec.json.decode, (msgspec.DecodeError,)
+    except ImportError:
+        pass
+    return json.loads, (ValueError,)
+
+
+class gJsonModel(JsonModel):
+    def __init__(
+        self,
+        dataWrapper: bool = False,
+        decoder: Decoder | None = None,
+        decodeErrors: tuple[type[Exception], ...] = (ValueError,),
+    ) -> None:
+        super().__init__(dataWrapper)
+        if decoder is None:
+            decoder, decodeErrors = findDecoder()
+        self._decoder = decoder
+        self._decodeErrors = decodeErrors
+
+    def deserialize(self, content: bytes | str) -> Any:
+        try:
+            body = self._decoder(content)
+        except self._decodeErrors:
+            if isinstance(content, bytes):
+                return content.decode("utf-8")
+            return content
+        if self._data_wrapper and type(body) is dict and "data" in body:
+            body = body["data"]
+        return body
@@ -0,0 +1,140 @@
+from .gData import (
+    gData,
+    gDataclass,
+    FieldsDict,
+    dataclassToFieldsDict,
+    getSchema,
+    resolveDeferredFields,
+)
+from .gColumns import gColumns
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Generator,
+    Generic,
+    Iterable,
+    Iterator,
+    Sequence,
+    TypeVar,
+    get_args,
+)
+
+if TYPE_CHECKING:
+    from concurrent.futures import Future
+
+T = TypeVar("T", bound=gDataclass)
+
+PageFetcher = Callable[[str | None], gData[Any]]
+
+
+def findItemsField(pageClass: type[gDataclass]) -> tuple[str, type[gDataclass]]:
+    candidates = [
+        (k, itemClass)
+        for k, kind, itemClass in getSchema(pageClass).wrappers
+        if kind == "list"
+    ]
+    if len(candidates) != 1:
+        raise ValueError(
+            f'Unable to find a single list field for class "{pageClass.__name__}"'
+        )
+    return candidates[0]
+
+
+class gPages(Generic[T]):
+    def __init__(
+        self,
+        fetchPage: PageFetcher,
+        pageClass: type[gDataclass],
+        fields: Sequence[Any] = (),
+        itemsField: str | None = None,
+        pageFields: Sequence[str] = (),
+        pageToken: str | None = None,
+        prefetch: bool = True,
+    ) -> None:
+        if itemsField is None:
+            itemsField, itemClass = findItemsField(pageClass)
+        else:
+            itemClass = get_args(getSchema(pageClass).types[itemsField])[0]
+        self._fetchPage = fetchPage
+        self._itemClass = itemClass
+        self._itemFieldNames = fields
+        self._itemsField = itemsField
+        self._pageToken = pageToken
+        self._prefetch = prefetch
+        itemFields = (
+            dataclassToFieldsDict(itemClass(*fields)) if len(fields) > 0 else None
+        )
+        self._fields: FieldsDict = {
+            "nextPageToken": None,
+            itemsField: {None: itemFields} if itemFields is not None else None,
+        }
+        for field in pageFields:
+            self._fields[field] = None
+
+    def _fetch(
+        self, pageToken: str | None, view: bool | None = None
+    ) -> gData[Any]:
+        page = self._fetchPage(pageToken)
+        if view is not None:
+            page._view = view
+        page._fetchFieldsDict(self._fields)
+        resolveDeferredFields()
+        return page
+
+    @staticmethod
+    def _nextPageToken(page: gData[Any]) -> str | None:
+        if page._hasAttribute("nextPageToken"):
+            return page._getAttributeUnchecked("nextPageToken")
+        return None
+
+    def fetch(
+        self, pageToken: str | None = None, view: bool | None = None
+    ) -> tuple[gData[Any], str | None]:
+        page = self._fetch(self._pageToken if pageToken is None else pageToken, view)
+        return page, self._nextPageToken(page)
+
+    def pages(self, view: bool | None = None) -> Generator[gData[Any], None, None]:
+        if not self._prefetch:
+            pageToken = self._pageToken
+            while True:
+                page = self._fetch(pageToken, view)
+                pageToken = self._nextPageToken(page)
+                yield page
+                if pageToken is None:
+                    return
+        from concurrent.futures import ThreadPoolExecutor
+
+        executor = ThreadPoolExecutor(max_workers=1)
+        try:
+            future: "Future[gData[Any]]" = executor.submit(
+                self._fetch, self._pageToken, view
+            )
+            while True:
+                page = future.result()
+                pageToken = self._nextPageToken(page)
+                if pageToken is not None:
+                    future = executor.submit(self._fetch, pageToken, view)
+                yield page
+                if pageToken is None:
+                    return
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def items(self, page: gData[Any]) -> Iterator[T]:
+        items = page._getAttributeWrapperSafe(self._itemsField)
+        if items is None or not items._hasData:
+            return iter(())
+        return iter(items)
+
+    def __iter__(self) -> Generator[T, None, None]:
+        for page in self.pages():
+            yield from self.items(page)
+
+    def asColumns(self, integers: Iterable[str] = ()) -> gColumns[T]:
+        columns: gColumns[T] = gColumns(self._itemClass, self._itemFieldNames, integers)
+        for page in self.pages(view=True):
+            items = page._getAttributeWrapperSafe(self._itemsField)
+            if items is not None and items._hasData:
+                columns.extend(items)
+        return columns
@@ -1,5 +1,9 @@
-from googleapiclient.discovery import Resource
-from typing import Any, Self
+from typing import TYPE_CHECKING, Any, Self
+
+if TYPE_CHECKING:
+    from googleapiclient.discovery import Resource
+else:
+    Resource = object
 
 
 class gResource(Resource):
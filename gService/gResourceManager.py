@@ -1,33 +1,163 @@
 from .gResource import gResource
-from .gData import gData, gDataclass
-import datetime
-from googleapiclient.http import (
-    MediaIoBaseDownload,
-    MediaFileUpload,
-    MediaDownloadProgress,
+from .gData import (
+    gData,
+    gDataclass,
+    gProfiledData,
+    getFieldLearner,
+    getRequestQueue,
+    getResponseCache,
 )
+from .gPages import gPages
+import datetime
+import functools
+import inspect
+import sys
+from contextvars import ContextVar
 from io import BufferedWriter
 from .utils import (
     object2dict,
     removeNonesDict,
     getFunctionName,
     getFunctionVariables,
+    getOverloadDispatcher,
     getOverloadedFunctionReturnTypeAndVariables,
 )
-from typing import Any, cast, Dict, Literal, Generator, overload, Self
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    cast,
+    Dict,
+    Literal,
+    Generator,
+    overload,
+    Self,
+    Sequence,
+    TypeVar,
+    get_args,
+    get_origin,
+)
 from types import TracebackType
 
+if TYPE_CHECKING:
+    from googleapiclient.http import MediaDownloadProgress
+
+
+def _requiresConversion(annotation: Any) -> bool:
+    if type(annotation) is str:
+        return True
+    if get_origin(annotation) is list or annotation is list:
+        return True
+    args = get_args(annotation)
+    if len(args) > 0 and get_origin(annotation) is not Literal:
+        return any(_requiresConversion(arg) for arg in args)
+    return annotation is datetime.datetime or (
+        isinstance(annotation, type) and issubclass(annotation, gDataclass)
+    )
+
+
+class _gCallPlan:
+    def __init__(self, function: Callable[..., Any]) -> None:
+        parameters = list(inspect.signature(function).parameters.values())[1:]
+        self.function = function
+        self.name = function.__name__
+        self.parameterNames = tuple(p.name for p in parameters)
+        self.defaults = {
+            p.name: p.default for p in parameters if p.default is not p.empty
+        }
+        self.convertedParameters = tuple(
+            p.name for p in parameters if _requiresConversion(p.annotation)
+        )
+        self.dispatchReturnType = getOverloadDispatcher(function)
+
+    def bind(self, args: tuple[Any, ...], kwargs: dict[str, Any]) -> dict[str, Any]:
+        result = self.defaults.copy()
+        result.update(zip(self.parameterNames, args))
+        result.update(kwargs)
+        return result
+
+    def getReturnType(self, kwargs: dict[str, Any]) -> Any:
+        return self.dispatchReturnType(kwargs)
+
+    def convertKwargs(self, kwargs: dict[str, Any]) -> None:
+        for k in self.convertedParameters:
+            if k in kwargs:
+                kwargs[k] = gResourceManager._convertValue(kwargs[k])
+
+
+class _gCall:
+    __slots__ = ("plan", "manager", "args", "kwargs")
+
+    def __init__(
+        self,
+        plan: _gCallPlan,
+        manager: "gResourceManager",
+        args: tuple[Any, ...],
+        kwargs: dict[str, Any],
+    ) -> None:
+        self.plan = plan
+        self.manager = manager
+        self.args = args
+        self.kwargs = kwargs
+
+    def getVariables(self) -> dict[str, Any]:
+        return self.plan.bind(self.args, self.kwargs)
+
+
+_currentCall: ContextVar[_gCall | None] = ContextVar("_currentCall", default=None)
+
+
+def _compileResourceMethod(function: Callable[..., Any]) -> Callable[..., Any]:
+    plan = _gCallPlan(function)
+
+    @functools.wraps(function)
+    def wrapper(self: "gResourceManager", *args: Any, **kwargs: Any) -> Any:
+        token = _currentCall.set(_gCall(plan, self, args, kwargs))
+        try:
+            return function(self, *args, **kwargs)
+        finally:
+            _currentCall.reset(token)
+
+    setattr(wrapper, "__gCallPlan__", plan)
+    return wrapper
+
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+
+def resourceMethod(function: F) -> F:
+    setattr(function, "__gResourceMethod__", True)
+    return function
+
 
 class gResourceManager:
     _resource: gResource
 
+    def __init_subclass__(cls, compileCalls: bool = True, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        if not compileCalls:
+            return
+        for name, value in list(cls.__dict__.items()):
+            if inspect.isfunction(value) and getattr(
+                value, "__gResourceMethod__", False
+            ):
+                setattr(cls, name, _compileResourceMethod(value))
+
     def __init__(self, resource: gResource) -> None:
         self._resource = resource
 
+    def _getConcurrency(self) -> int:
+        from .gTransport import gHttpPool
+
+        http = getattr(self._resource, "_http", None)
+        return http.maxSize if isinstance(http, gHttpPool) else 1
+
     @staticmethod
     def _downloadMedia(
         fd: BufferedWriter, request: gResource
-    ) -> Generator[MediaDownloadProgress, Any, None]:
+    ) -> Generator["MediaDownloadProgress", Any, None]:
+        from googleapiclient.http import MediaIoBaseDownload
+
         downloader = MediaIoBaseDownload(fd, request)
         done = False
         while done is False:
@@ -40,30 +170,91 @@ class gResourceManager:
         del kwargs[name]
 
     @staticmethod
-    def _convertKwargs(kwargs: dict[str, Any]):
+    def _convertValue(v: Any) -> Any:
+        if isinstance(v, gDataclass):
+            return object2dict(v, gDataclass)
+        elif type(v) is list:
+            return ",".join(cast(list[Any], v))
+        elif type(v) is datetime.datetime:
+            return v.isoformat()
+        return v
+
+    @classmethod
+    def _convertKwargs(cls, kwargs: dict[str, Any]):
         for k, v in kwargs.items():
-            if isinstance(v, gDataclass):
-                kwargs[k] = object2dict(v, gDataclass)
-            elif type(v) is list:
-                kwargs[k] = ",".join(cast(list[Any], v))
-            elif type(v) is datetime.datetime:
-                kwargs[k] = v.isoformat()
+            kwargs[k] = cls._convertValue(v)
 
     @classmethod
     def _prepareKwargs(
         cls,
         kwargs: dict[str, Any],
         body: str | None,
+        plan: _gCallPlan | None = None,
     ) -> None:
-        cls._convertKwargs(kwargs)
+        if plan is not None:
+            plan.convertKwargs(kwargs)
+        else:
+            cls._convertKwargs(kwargs)
+            del kwargs["self"]
         if body is not None:
             cls._moveToKwargsBody(kwargs, body)
-        del kwargs["self"]
+
+    @staticmethod
+    def _checkForErrors(data: Any) -> None:
+        if data is not None and len(data) != 0:
+            raise Exception(data)
+
+    def _getCurrentCall(self) -> _gCall | None:
+        call = _currentCall.get()
+        if call is not None and call.manager is self:
+            return call
+        return None
 
     def _getRawResource(self, depth: int = 1, suffix: str = ""):
-        name = getFunctionName(depth + 1)
+        call = self._getCurrentCall()
+        if call is not None:
+            name = call.plan.name
+        else:
+            name = getFunctionName(depth + 1)
         return getattr(self._resource, name + suffix)
 
+    def _getCallVariables(self, depth: int = 1) -> dict[str, Any]:
+        call = self._getCurrentCall()
+        if call is not None:
+            return call.getVariables()
+        return getFunctionVariables(depth + 1)
+
+    def _createData(
+        self,
+        variableClass: Any,
+        resource: gResource,
+        kwargs: dict[str, Any],
+        executeOnlyOnce: bool,
+        plan: _gCallPlan | None,
+        depth: int = 1,
+    ) -> gData[Any]:
+        learner = getFieldLearner()
+        if learner is None:
+            return gData(variableClass, resource, kwargs, executeOnlyOnce)
+        frame = sys._getframe(depth + (2 if plan is not None else 1))
+        name = plan.name if plan is not None else getFunctionName(depth + 1)
+        key = f"{type(self).__name__}.{name}@{frame.f_code.co_filename}:{frame.f_lineno}"
+        return gProfiledData(
+            variableClass, resource, kwargs, executeOnlyOnce, learner, key
+        )
+
+    def _getCallReturnTypeAndVariables(
+        self, depth: int = 1
+    ) -> tuple[Any, dict[str, Any], _gCallPlan | None]:
+        call = self._getCurrentCall()
+        if call is not None:
+            kwargs = call.getVariables()
+            return call.plan.getReturnType(kwargs), kwargs, call.plan
+        variableClass, kwargs = getOverloadedFunctionReturnTypeAndVariables(
+            self, depth + 1
+        )
+        return variableClass, kwargs, None
+
     @overload
     def _getResource(
         self,
@@ -86,19 +277,28 @@ class gResourceManager:
         body: str | None = None,
         depth: int = 1,
     ) -> Any | None:
-        variableClass, kwargs = getOverloadedFunctionReturnTypeAndVariables(
-            self, depth + 1
-        )
+        variableClass, kwargs, plan = self._getCallReturnTypeAndVariables(depth + 1)
         kwargs = removeNonesDict(kwargs)
-        self._prepareKwargs(kwargs, body)
+        self._prepareKwargs(kwargs, body, plan)
         resource = self._getRawResource(depth + 1)
         if executionPolicy == "checkForErrors":
-            data = resource(**kwargs).execute()
-            if len(data) != 0:
-                raise Exception(data)
+            request = resource(**kwargs)
+            cache = getResponseCache()
+            if cache is not None:
+                cache.invalidate(request)
+            queue = getRequestQueue()
+            if queue is not None:
+                queue.addRequest(request, self._checkForErrors, request)
+            else:
+                self._checkForErrors(request.execute())
         else:
-            return gData(
-                variableClass, resource, kwargs, executionPolicy == "executeOnlyOnce"
+            return self._createData(
+                variableClass,
+                resource,
+                kwargs,
+                executionPolicy == "executeOnlyOnce",
+                plan,
+                depth + 1,
             )
 
     def _uploadResource(
@@ -108,19 +308,21 @@ class gResourceManager:
         body: str | None = None,
         depth: int = 1,
     ) -> Any:
-        variableClass, kwargs = getOverloadedFunctionReturnTypeAndVariables(
-            self, depth + 1
-        )
+        variableClass, kwargs, plan = self._getCallReturnTypeAndVariables(depth + 1)
         kwargs = removeNonesDict(kwargs)
         filePath: str = kwargs[filePathKey]
         resumable: bool = kwargs[resumableKey]
         del kwargs[filePathKey]
         del kwargs[resumableKey]
+        from googleapiclient.http import MediaFileUpload
+
         media = MediaFileUpload(filePath, resumable=resumable)
         kwargs["media_body"] = media
-        self._prepareKwargs(kwargs, body)
+        self._prepareKwargs(kwargs, body, plan)
         resource = self._getRawResource(depth + 1)
-        return gData(variableClass, resource, kwargs, executeOnlyOnce=True)
+        return self._createData(
+            variableClass, resource, kwargs, True, plan, depth + 1
+        )
 
     def _downloadResource(
         self,
@@ -128,13 +330,36 @@ class gResourceManager:
         body: str | None = None,
         depth: int = 1,
     ):
-        kwargs = removeNonesDict(getFunctionVariables(depth + 1))
+        call = self._getCurrentCall()
+        kwargs = removeNonesDict(self._getCallVariables(depth + 1))
         fd: BufferedWriter = kwargs[fdKey]
         del kwargs[fdKey]
-        self._prepareKwargs(kwargs, body)
+        self._prepareKwargs(kwargs, body, call.plan if call is not None else None)
         resource = self._getRawResource(depth + 1, suffix="_media")
         return self._downloadMedia(fd, resource(**kwargs))
 
+    def iterate(
+        self,
+        method: Callable[..., Any],
+        *fields: Any,
+        itemsField: str | None = None,
+        pageFields: Sequence[str] = (),
+        prefetch: bool | None = None,
+        **kwargs: Any,
+    ) -> gPages[Any]:
+        pageToken = kwargs.pop("pageToken", None)
+        if prefetch is None:
+            prefetch = self._getConcurrency() > 1
+        return gPages(
+            lambda token: method(**kwargs, pageToken=token),
+            method.__annotations__["return"],
+            fields,
+            itemsField,
+            pageFields,
+            pageToken,
+            prefetch,
+        )
+
     def __enter__(self) -> Self:
         self._resource.__enter__()
         return self
@@ -0,0 +1,115 @@
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Callable, Generator
+
+
+def createHttp(credentials: Any = None) -> Any:
+    from googleapiclient.http import build_http
+
+    http = build_http()
+    if credentials is None:
+        return http
+    from google_auth_httplib2 import AuthorizedHttp
+
+    return AuthorizedHttp(credentials, http=http)
+
+
+class gHttpPool:
+    def __init__(
+        self,
+        createHttp: Callable[[], Any] = createHttp,
+        maxSize: int = 10,
+        credentials: Any = None,
+    ) -> None:
+        if maxSize < 1:
+            raise ValueError("Pool size has to be at least 1")
+        self.credentials = credentials
+        self._createHttp = createHttp
+        self._maxSize = maxSize
+        self._condition = threading.Condition()
+        self._idle: list[Any] = []
+        self._size = 0
+        self._closed = False
+        self._requests = 0
+        self._created = 0
+        self._reused = 0
+        self._waits = 0
+        self._waitSeconds = 0.0
+
+    @property
+    def maxSize(self) -> int:
+        return self._maxSize
+
+    def acquire(self) -> Any:
+        with self._condition:
+            if self._closed:
+                raise RuntimeError("Connection pool is closed")
+            self._requests += 1
+            if len(self._idle) == 0 and self._size >= self._maxSize:
+                self._waits += 1
+                start = time.perf_counter()
+                while len(self._idle) == 0:
+                    self._condition.wait()
+                self._waitSeconds += time.perf_counter() - start
+            if len(self._idle) > 0:
+                self._reused += 1
+                return self._idle.pop()
+            self._size += 1
+            self._created += 1
+        try:
+            return self._createHttp()
+        except BaseException:
+            with self._condition:
+                self._size -= 1
+                self._condition.notify()
+            raise
+
+    def release(self, http: Any) -> None:
+        with self._condition:
+            if not self._closed:
+                self._idle.append(http)
+                self._condition.notify()
+                return
+            self._size -= 1
+        http.close()
+
+    @contextmanager
+    def connection(self) -> Generator[Any, None, None]:
+        http = self.acquire()
+        try:
+            yield http
+        finally:
+            self.release(http)
+
+    def request(self, *args: Any, **kwargs: Any) -> Any:
+        with self.connection() as http:
+            return http.request(*args, **kwargs)
+
+    def close(self) -> None:
+        with self._condition:
+            self._closed = True
+            idle = self._idle
+            self._idle = []
+            self._size -= len(idle)
+        for http in idle:
+            http.close()
+
+    @staticmethod
+    def _countConnections(http: Any) -> int:
+        return len(getattr(getattr(http, "http", http), "connections", ()))
+
+    def stats(self) -> dict[str, int | float]:
+        with self._condition:
+            return {
+                "maxSize": self._maxSize,
+                "size": self._size,
+                "idle": len(self._idle),
+                "inUse": self._size - len(self._idle),
+                "connections": sum(self._countConnections(h) for h in self._idle),
+                "requests": self._requests,
+                "created": self._created,
+                "reused": self._reused,
+                "waits": self._waits,
+                "waitSeconds": self._waitSeconds,
+            }
@@ -1,4 +1,6 @@
 import inspect
+import sys
+from weakref import WeakKeyDictionary
 from typing import (
     Any,
     Callable,
@@ -163,9 +165,22 @@ def mergeDicts(dicts: Iterable[dict[Any, Any]]) -> dict[Any, Any]:
     return result
 
 
+def estimateSize(obj: Any) -> int:
+    size = sys.getsizeof(obj)
+    if type(obj) is dict:
+        for k, v in cast(dict[Any, Any], obj).items():
+            size += estimateSize(k) + estimateSize(v)
+    elif type(obj) is list or type(obj) is tuple:
+        for v in cast(Iterable[Any], obj):
+            size += estimateSize(v)
+    return size
+
+
 def swapDict(d: dict[K, V]) -> dict[V, K]:
-    values = list(d.values())
-    return dict((v, k) for k, v in d.items() if values.count(v) == 1)
+    counts: dict[V, int] = {}
+    for v in d.values():
+        counts[v] = counts.get(v, 0) + 1
+    return dict((v, k) for k, v in d.items() if counts[v] == 1)
 
 
 def isSubclassOrigin(some_type: type, real_class: type):
@@ -186,31 +201,70 @@ def dictsDiff(dicts: Sequence[dict[K, V]]) -> dict[K, list[V]]:
     return result
 
 
+class OverloadDispatcher:
+    def __init__(self, ref: Callable[..., Any]) -> None:
+        self._name = ref.__name__
+        self._table: dict[tuple[Any, ...], Any] = {}
+        overloads = get_overloads(ref)
+        if len(overloads) == 0:
+            self._keys: tuple[str, ...] = ()
+            self._candidates = [((), ref.__annotations__.get("return"))]
+        elif len(overloads) == 1:
+            self._keys = ()
+            self._candidates = [((), overloads[0].__annotations__["return"])]
+        else:
+            annotations = list(map(lambda x: x.__annotations__, overloads))
+            self._keys = tuple(k for k in dictsDiff(annotations) if k != "return")
+            self._candidates = [
+                (tuple(a.get(k) for k in self._keys), a["return"])
+                for a in annotations
+            ]
+        if len(self._keys) == 0:
+            self._table[()] = self._candidates[0][1]
+
+    def _resolve(self, key: tuple[Any, ...]) -> Any:
+        for types, returnType in self._candidates:
+            if types == key:
+                return returnType
+        raise RuntimeError(
+            f'Unable to find overload return type for function "{self._name}"'
+        )
+
+    def __call__(self, kwargs: dict[str, Any]) -> Any:
+        key = tuple(
+            type(kwargs[k]) if kwargs[k] is not None else None for k in self._keys
+        )
+        try:
+            return self._table[key]
+        except KeyError:
+            returnType = self._resolve(key)
+            self._table[key] = returnType
+            return returnType
+
+
+_overloadDispatchers: "WeakKeyDictionary[Callable[..., Any], OverloadDispatcher]" = (
+    WeakKeyDictionary()
+)
+
+
+def getOverloadDispatcher(ref: Callable[..., Any]) -> OverloadDispatcher:
+    ref = getattr(ref, "__func__", ref)
+    dispatcher = _overloadDispatchers.get(ref)
+    if dispatcher is None:
+        dispatcher = OverloadDispatcher(ref)
+        _overloadDispatchers[ref] = dispatcher
+    return dispatcher
+
+
+def getOverloadedFunctionReturnType(
+    ref: Callable[..., Any], kwargs: dict[str, Any]
+) -> Any:
+    return getOverloadDispatcher(ref)(kwargs)
+
+
 def getOverloadedFunctionReturnTypeAndVariables(
     module: object, depth: int = 1
 ) -> tuple[Any, dict[str, Any]]:
     ref = getFunctionRef(module, depth + 1)
     kwargs = getFunctionVariables(depth + 1)
-    overloads = get_overloads(ref)
-    if len(overloads) == 0:
-        return ref.__annotations__["return"], kwargs
-    elif len(overloads) == 1:
-        return overloads[0].__annotations__["return"], kwargs
-    overloadsDiffDict = dictsDiff(list(map(lambda x: x.__annotations__, overloads)))
-    overloadsDiff = [
-        {k: v for k, v in zip(overloadsDiffDict.keys(), vals) if k != "return"}
-        for vals in zip(*overloadsDiffDict.values())
-    ]
-    kwargsTypes = {
-        k: type(v) if v is not None else None for k, v in kwargs.items() if k != "self"
-    }
-    for i, overloadDiff in enumerate(overloadsDiff):
-        success = True
-        for k, v in overloadDiff.items():
-            if kwargsTypes[k] != v:
-                success = False
-        if success:
-            return overloadsDiffDict["return"][i], kwargs
-    raise RuntimeError(
-        f'Unable to find overload return type for function "{ref.__name__}"'
-    )
+    return getOverloadedFunctionReturnType(ref, kwargs), kwargs